@@ -2,9 +2,15 @@
 
 import asyncio
 import logging
-from typing import Dict, List, Type
+import time
+from typing import Dict, List, Optional, Type
 
 from app.fetchers.base import BaseFetcher, ContentItem
+from app.fetchers.dedup import deduplicate
+from app.fetchers.refresher import BackgroundRefresher
+from app.fetchers.snapshot import ContentSnapshot, content_version
+from app.services import metrics
+from config import config
 
 logger = logging.getLogger(__name__)
 
@@ -13,11 +19,15 @@ class FetcherRegistry:
     """Registry for all content fetchers."""
 
     _fetchers: Dict[str, BaseFetcher] = {}
+    _refresher: Optional[BackgroundRefresher] = None
+    _snapshot: Optional[ContentSnapshot] = None
+    _snapshot_lock: Optional[asyncio.Lock] = None
 
     @classmethod
     def register(cls, fetcher: BaseFetcher) -> None:
         """Register a fetcher instance."""
         cls._fetchers[fetcher.name] = fetcher
+        metrics.registry.register_cache(f"fetcher:{fetcher.name}", fetcher.cache.stats)
         logger.debug(f"Registered fetcher: {fetcher.name}")
 
     @classmethod
@@ -25,6 +35,30 @@ class FetcherRegistry:
         """Get all enabled and available fetchers."""
         return [f for f in cls._fetchers.values() if f.enabled and f.is_available()]
 
+    @classmethod
+    def start_background_refresh(cls) -> None:
+        """Keep enabled fetchers warm from the running event loop."""
+        if cls._refresher is None:
+            cls._refresher = BackgroundRefresher(cls.get_enabled())
+            cls._refresher.start()
+
+    @classmethod
+    async def stop_background_refresh(cls) -> None:
+        if cls._refresher is not None:
+            await cls._refresher.stop()
+            cls._refresher = None
+
+    @classmethod
+    def content_expires_at(cls) -> Optional[float]:
+        """Earliest time any enabled fetcher's cached result goes stale, if any are cached and fresh.
+
+        Results already past expiry (served stale while their source is failing)
+        are ignored; the snapshot version already changes when they are replaced.
+        """
+        now = time.time()
+        expiries = [f.expires_at for f in cls.get_enabled() if f.expires_at > now]
+        return min(expiries) if expiries else None
+
     @classmethod
     async def fetch_all(cls) -> List[ContentItem]:
         """Fetch from all enabled sources, handling failures gracefully."""
@@ -37,11 +71,18 @@ class FetcherRegistry:
 
         logger.info(f"Fetching from {len(fetchers)} sources: {[f.name for f in fetchers]}")
 
-        tasks = [fetcher.fetch() for fetcher in fetchers]
+        tasks = [
+            asyncio.wait_for(fetcher.fetch(), timeout=fetcher.fetch_timeout_seconds)
+            for fetcher in fetchers
+        ]
         outcomes = await asyncio.gather(*tasks, return_exceptions=True)
 
         for fetcher, outcome in zip(fetchers, outcomes):
-            if isinstance(outcome, Exception):
+            if isinstance(outcome, asyncio.TimeoutError):
+                logger.warning(
+                    f"Fetcher '{fetcher.name}' timed out after {fetcher.fetch_timeout_seconds}s"
+                )
+            elif isinstance(outcome, Exception):
                 logger.warning(f"Fetcher '{fetcher.name}' failed: {outcome}")
             else:
                 logger.info(f"Fetcher '{fetcher.name}' returned {len(outcome)} items")
@@ -49,6 +90,40 @@ class FetcherRegistry:
 
         return results
 
+    @classmethod
+    async def snapshot(cls) -> ContentSnapshot:
+        """Return the shared content snapshot, building a new one once per window.
+
+        Every message generated within the window reuses the same items and
+        formatted prompt body; concurrent callers wait for a single build.
+        """
+        if cls._snapshot is not None and cls._snapshot.is_fresh():
+            return cls._snapshot
+
+        if cls._snapshot_lock is None:
+            cls._snapshot_lock = asyncio.Lock()
+        async with cls._snapshot_lock:
+            if cls._snapshot is not None and cls._snapshot.is_fresh():
+                return cls._snapshot
+
+            items = await cls.fetch_all()
+            if config('fetchers.dedup_threshold') < 1:
+                items = deduplicate(items, config('fetchers.dedup_threshold'))
+            items = tuple(items)
+            window = config('fetchers.snapshot_seconds')
+            if not items:
+                window = min(window, 60)  # Don't pin an empty snapshot for a whole window
+            now = time.time()
+            cls._snapshot = ContentSnapshot(
+                items=items,
+                formatted=format_content_for_prompt(list(items)),
+                version=content_version(items),
+                created_at=now,
+                expires_at=now + window,
+            )
+            logger.info(f"Built content snapshot {cls._snapshot.version} with {len(items)} items")
+            return cls._snapshot
+
 
 def format_content_for_prompt(items: List[ContentItem]) -> str:
     """Format content items grouped by category for the LLM prompt."""
@@ -66,7 +141,8 @@ def format_content_for_prompt(items: List[ContentItem]) -> str:
         section_title = category.replace("_", " ").upper()
         section_items = []
         for item in cat_items:
-            line = f"- [{item.source}] {item.title}"
+            sources = " / ".join((item.source, *item.merged_sources))
+            line = f"- [{sources}] {item.title}"
             if item.summary:
                 line += f": {item.summary[:150]}"
             section_items.append(line)
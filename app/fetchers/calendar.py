@@ -1,12 +1,10 @@
 """Calendar fetcher for UK bank holidays and seasonal awareness."""
 
+import json
 import logging
 from datetime import datetime, timedelta
-from functools import lru_cache
 from typing import List
 
-import httpx
-
 from app.fetchers.base import BaseFetcher, ContentCategory, ContentItem
 
 logger = logging.getLogger(__name__)
@@ -18,52 +16,46 @@ class CalendarFetcher(BaseFetcher):
     name = "calendar"
     category = ContentCategory.CALENDAR
     cache_ttl_seconds = 86400  # 24 hours
+    expires_at_midnight = True
+    stale_grace_seconds = 0  # Yesterday's holiday is wrong, not stale
     max_items = 2
 
     GOV_UK_API = "https://www.gov.uk/bank-holidays.json"
 
-    async def fetch(self) -> List[ContentItem]:
+    async def _fetch(self) -> List[ContentItem]:
         """Fetch calendar events and seasonal context."""
-        return self._fetch_cached(self._ttl_hash())
-
-    @lru_cache(maxsize=1)
-    def _fetch_cached(self, ttl_hash: int) -> List[ContentItem]:
         items: List[ContentItem] = []
         today = datetime.now().date()
 
         # Fetch bank holidays
-        try:
-            response = httpx.get(self.GOV_UK_API, timeout=10.0)
-            response.raise_for_status()
-            data = response.json()
-
-            england_holidays = data.get("england-and-wales", {}).get("events", [])
-            for holiday in england_holidays:
-                holiday_date = datetime.strptime(holiday["date"], "%Y-%m-%d").date()
-                if holiday_date == today:
-                    items.append(ContentItem(
-                        title=f"Today is {holiday['title']}!",
-                        category=self.category,
-                        source="GOV.UK",
-                        relevance_score=1.0,
-                        is_time_sensitive=True
-                    ))
-                elif holiday_date == today + timedelta(days=1):
-                    items.append(ContentItem(
-                        title=f"Tomorrow is {holiday['title']}",
-                        category=self.category,
-                        source="GOV.UK",
-                        relevance_score=0.9
-                    ))
-                elif 2 <= (holiday_date - today).days <= 7:
-                    items.append(ContentItem(
-                        title=f"{holiday['title']} is coming up on {holiday_date.strftime('%A')}",
-                        category=self.category,
-                        source="GOV.UK",
-                        relevance_score=0.7
-                    ))
-        except Exception as e:
-            logger.error(f"Bank holiday fetch failed: {e}")
+        # The holiday list rarely changes, so this is usually a 304
+        data = await self._conditional_get(self.GOV_UK_API, json.loads)
+
+        england_holidays = data.get("england-and-wales", {}).get("events", [])
+        for holiday in england_holidays:
+            holiday_date = datetime.strptime(holiday["date"], "%Y-%m-%d").date()
+            if holiday_date == today:
+                items.append(ContentItem(
+                    title=f"Today is {holiday['title']}!",
+                    category=self.category,
+                    source="GOV.UK",
+                    relevance_score=1.0,
+                    is_time_sensitive=True
+                ))
+            elif holiday_date == today + timedelta(days=1):
+                items.append(ContentItem(
+                    title=f"Tomorrow is {holiday['title']}",
+                    category=self.category,
+                    source="GOV.UK",
+                    relevance_score=0.9
+                ))
+            elif 2 <= (holiday_date - today).days <= 7:
+                items.append(ContentItem(
+                    title=f"{holiday['title']} is coming up on {holiday_date.strftime('%A')}",
+                    category=self.category,
+                    source="GOV.UK",
+                    relevance_score=0.7
+                ))
 
         # Add seasonal context
         items.extend(self._get_seasonal_context(today))
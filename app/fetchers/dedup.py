@@ -0,0 +1,120 @@
+"""Near-duplicate detection across sources, using MinHash signatures and LSH buckets."""
+
+import logging
+import random
+import re
+import zlib
+from dataclasses import replace
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+from app.fetchers.base import ContentItem
+
+logger = logging.getLogger(__name__)
+
+NUM_BANDS = 8
+ROWS_PER_BAND = 4
+NUM_HASHES = NUM_BANDS * ROWS_PER_BAND
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x600D5C00)  # Fixed seed: signatures are comparable across runs
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_HASHES)]
+
+# Google News appends " - Publisher" to titles
+_PUBLISHER_SUFFIX = re.compile(r"\s+[-–|]\s+[^-–|]{2,40}$")
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def normalise_title(title: str, strip_publisher: bool = False) -> str:
+    """Lowercase the title and drop punctuation, and optionally a trailing publisher name."""
+    title = title.strip()
+    if strip_publisher:
+        title = _PUBLISHER_SUFFIX.sub("", title)
+    return _NON_WORD.sub(" ", title.lower()).strip()
+
+
+def minhash(words: FrozenSet[str]) -> Tuple[int, ...]:
+    """MinHash signature over a title's words."""
+    hashes = [zlib.crc32(word.encode()) for word in words]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two titles' word sets."""
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def deduplicate(items: List[ContentItem], threshold: float = 0.8) -> List[ContentItem]:
+    """Collapse duplicate stories, keeping the most relevant item of each cluster.
+
+    Identical normalised titles are merged whatever their source, found with
+    one dict lookup. Near-duplicates are only merged across sources: one
+    source doesn't run the same story twice, but similar headlines about
+    different events ("Man arrested..." / "Woman arrested...") are common.
+    Only clusters sharing an LSH band bucket are compared, by the exact word
+    Jaccard similarity, so the work stays linear in the number of items. Each
+    kept item lists the other sources it was merged with, and is
+    time-sensitive if any duplicate was.
+    """
+    clusters: List[List[ContentItem]] = []
+    cluster_sources: List[Set[str]] = []
+    cluster_words: List[FrozenSet[str]] = []
+    by_title: Dict[str, int] = {}
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+
+    for item in items:
+        title = normalise_title(item.title, strip_publisher=item.publisher_in_title)
+        cluster = by_title.get(title) if title else None
+
+        words = frozenset(title.split())
+        signature = minhash(words) if words else ()
+        bands = [
+            (band, signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND])
+            for band in range(NUM_BANDS)
+        ] if signature else []
+
+        if cluster is None:
+            for key in bands:
+                for candidate in buckets.get(key, ()):
+                    if (
+                        item.source not in cluster_sources[candidate]
+                        and similarity(words, cluster_words[candidate]) >= threshold
+                    ):
+                        cluster = candidate
+                        break
+                if cluster is not None:
+                    break
+
+        if cluster is None:
+            cluster = len(clusters)
+            clusters.append([item])
+            cluster_sources.append({item.source})
+            cluster_words.append(words)
+            if title:
+                by_title[title] = cluster
+            for key in bands:
+                buckets.setdefault(key, []).append(cluster)
+        else:
+            clusters[cluster].append(item)
+            cluster_sources[cluster].add(item.source)
+
+    results = [_merge(cluster) for cluster in clusters]
+    if len(results) < len(items):
+        logger.info(f"Merged {len(items) - len(results)} duplicate items ({len(items)} -> {len(results)})")
+    return results
+
+
+def _merge(cluster: List[ContentItem]) -> ContentItem:
+    if len(cluster) == 1:
+        return cluster[0]
+
+    best = max(cluster, key=lambda item: item.relevance_score)
+    sources = []
+    for item in cluster:
+        for source in (item.source, *item.merged_sources):
+            if source != best.source and source not in sources:
+                sources.append(source)
+    return replace(
+        best,
+        merged_sources=tuple(sources),
+        is_time_sensitive=any(item.is_time_sensitive for item in cluster),
+    )
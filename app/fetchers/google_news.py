@@ -2,11 +2,9 @@
 
 import logging
 import time
-from functools import lru_cache
 from typing import List
 
 from markdownify import markdownify as md
-from pygooglenews import GoogleNews
 
 from app.fetchers.base import BaseFetcher, ContentCategory, ContentItem
 
@@ -20,32 +18,30 @@ class GoogleNewsFetcher(BaseFetcher):
     category = ContentCategory.WORLD_NEWS
     cache_ttl_seconds = 3600  # 1 hour
     max_items = 8
+    publisher_in_title = True
 
-    async def fetch(self) -> List[ContentItem]:
+    # Same feed pygooglenews' top_news() reads, fetched over the shared client
+    RSS_URL = "https://news.google.com/rss"
+    RSS_PARAMS = {"ceid": "GB:en", "hl": "en", "gl": "GB"}
+
+    async def _fetch(self) -> List[ContentItem]:
         """Fetch top news."""
-        return self._fetch_cached(self._ttl_hash())
-
-    @lru_cache(maxsize=1)
-    def _fetch_cached(self, ttl_hash: int) -> List[ContentItem]:
-        try:
-            gn = GoogleNews(lang="en", country="GB")
-            top_news = gn.top_news()
-            articles = top_news.get("entries", [])
-
-            items: List[ContentItem] = []
-            for article in articles[:self.max_items]:
-                title = article.get("title", "")
-                summary = md(article.get("summary", ""), strip=["a"])[:200]
-
-                items.append(ContentItem(
-                    title=title,
-                    summary=summary,
-                    category=self.category,
-                    source="Google News",
-                    relevance_score=0.7
-                ))
-
-            return items
-        except Exception as e:
-            logger.error(f"Google News fetch failed: {e}")
-            return []
+        return await self._fetch_feed(self.RSS_URL, self._build_items, params=self.RSS_PARAMS)
+
+    def _build_items(self, feed) -> List[ContentItem]:
+        items: List[ContentItem] = []
+        for article in feed.entries[:self.max_items]:
+            title = article.get("title", "")
+            summary = md(article.get("summary", ""), strip=["a"])[:200]
+
+            items.append(ContentItem(
+                title=title,
+                summary=summary,
+                category=self.category,
+                source="Google News",
+                relevance_score=0.7,
+                published_at=self._published_at(article),
+                publisher_in_title=self.publisher_in_title,
+            ))
+
+        return items
@@ -1,11 +1,8 @@
 """Newcastle University news fetcher."""
 
 import logging
-from functools import lru_cache
 from typing import List
 
-import feedparser
-
 from app.fetchers.base import BaseFetcher, ContentCategory, ContentItem
 
 logger = logging.getLogger(__name__)
@@ -22,29 +19,24 @@ class NewcastleUniFetcher(BaseFetcher):
     # Newcastle University news RSS feed
     RSS_URL = "https://www.ncl.ac.uk/press/news/rss/"
 
-    async def fetch(self) -> List[ContentItem]:
+    async def _fetch(self) -> List[ContentItem]:
         """Fetch university news."""
-        return self._fetch_cached(self._ttl_hash())
-
-    @lru_cache(maxsize=1)
-    def _fetch_cached(self, ttl_hash: int) -> List[ContentItem]:
-        try:
-            feed = feedparser.parse(self.RSS_URL)
-            items: List[ContentItem] = []
-
-            for entry in feed.entries[:self.max_items]:
-                title = entry.get("title", "")
-                summary = entry.get("summary", "")[:200] if entry.get("summary") else None
-
-                items.append(ContentItem(
-                    title=title,
-                    summary=summary,
-                    category=self.category,
-                    source="Newcastle University",
-                    relevance_score=0.85  # Relevant to Jamie's PhD
-                ))
-
-            return items
-        except Exception as e:
-            logger.error(f"Newcastle Uni fetch failed: {e}")
-            return []
+        return await self._fetch_feed(self.RSS_URL, self._build_items)
+
+    def _build_items(self, feed) -> List[ContentItem]:
+        items: List[ContentItem] = []
+
+        for entry in feed.entries[:self.max_items]:
+            title = entry.get("title", "")
+            summary = entry.get("summary", "")[:200] if entry.get("summary") else None
+
+            items.append(ContentItem(
+                title=title,
+                summary=summary,
+                category=self.category,
+                source="Newcastle University",
+                relevance_score=0.85,  # Relevant to Jamie's PhD
+                published_at=self._published_at(entry),
+            ))
+
+        return items
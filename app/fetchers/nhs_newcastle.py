@@ -1,11 +1,8 @@
 """NHS Newcastle / Freeman Hospital news fetcher."""
 
 import logging
-from functools import lru_cache
 from typing import List
 
-from pygooglenews import GoogleNews
-
 from app.fetchers.base import BaseFetcher, ContentCategory, ContentItem
 
 logger = logging.getLogger(__name__)
@@ -18,33 +15,37 @@ class NHSNewcastleFetcher(BaseFetcher):
     category = ContentCategory.HEALTH
     cache_ttl_seconds = 14400  # 4 hours (hospital news is infrequent)
     max_items = 2
+    publisher_in_title = True  # Google News search results
 
     # Search terms for relevant hospital news
     SEARCH_QUERY = '"Freeman Hospital" OR "Newcastle Hospitals NHS" OR "RVI Newcastle"'
+    SEARCH_URL = "https://news.google.com/rss/search"
 
-    async def fetch(self) -> List[ContentItem]:
+    async def _fetch(self) -> List[ContentItem]:
         """Fetch hospital-related news."""
-        return self._fetch_cached(self._ttl_hash())
-
-    @lru_cache(maxsize=1)
-    def _fetch_cached(self, ttl_hash: int) -> List[ContentItem]:
-        try:
-            gn = GoogleNews(lang="en", country="GB")
-            search_results = gn.search(self.SEARCH_QUERY, when="7d")  # Last 7 days
-            articles = search_results.get("entries", [])
-
-            items: List[ContentItem] = []
-            for article in articles[:self.max_items]:
-                title = article.get("title", "")
-
-                items.append(ContentItem(
-                    title=title,
-                    category=self.category,
-                    source="NHS Newcastle",
-                    relevance_score=0.85  # Relevant to wife's work
-                ))
-
-            return items
-        except Exception as e:
-            logger.error(f"NHS Newcastle fetch failed: {e}")
-            return []
+        return await self._fetch_feed(
+            self.SEARCH_URL,
+            self._build_items,
+            params={
+                "q": f"{self.SEARCH_QUERY} when:7d",  # Last 7 days
+                "ceid": "GB:en",
+                "hl": "en",
+                "gl": "GB",
+            },
+        )
+
+    def _build_items(self, feed) -> List[ContentItem]:
+        items: List[ContentItem] = []
+        for article in feed.entries[:self.max_items]:
+            title = article.get("title", "")
+
+            items.append(ContentItem(
+                title=title,
+                category=self.category,
+                source="NHS Newcastle",
+                relevance_score=0.85,  # Relevant to wife's work
+                published_at=self._published_at(article),
+                publisher_in_title=self.publisher_in_title,
+            ))
+
+        return items
@@ -0,0 +1,105 @@
+"""Deterministic pre-LLM ranking and top-K selection of content items."""
+
+import time
+from typing import Dict, Iterable, List, Optional
+
+from app.fetchers.base import ContentCategory, ContentItem
+from config import config
+
+# Most items per category, mirroring the CONTENT BALANCING rules in the daily prompt
+DEFAULT_QUOTAS: Dict[str, int] = {
+    ContentCategory.WEATHER.value: 1,
+    ContentCategory.LOCAL_NEWS.value: 4,
+    ContentCategory.UNIVERSITY.value: 2,
+    ContentCategory.HEALTH.value: 2,
+    ContentCategory.TECH.value: 2,
+    ContentCategory.CALENDAR.value: 2,
+    ContentCategory.HISTORY.value: 1,
+    ContentCategory.WORLD_NEWS.value: 3,
+}
+
+# Categories that always make the cut ("Weather: Always mention briefly")
+ALWAYS_INCLUDE = (ContentCategory.WEATHER.value,)
+
+TIME_SENSITIVE_BONUS = 0.25
+
+
+def score(
+    item: ContentItem,
+    weights: Optional[Dict[str, float]] = None,
+    half_life_hours: float = 24.0,
+    now: Optional[float] = None,
+) -> float:
+    """Relevance adjusted for the user's category weight, freshness and urgency.
+
+    Freshness halves the distance to a floor of 0.5 every ``half_life_hours``;
+    items without a publish time count as fresh.
+    """
+    value = item.relevance_score * (weights or {}).get(item.category.value, 1.0)
+    if item.published_at is not None and half_life_hours > 0:
+        age_hours = max((now or time.time()) - item.published_at, 0.0) / 3600
+        value *= 0.5 + 0.5 * 0.5 ** (age_hours / half_life_hours)
+    if item.is_time_sensitive:
+        value += TIME_SENSITIVE_BONUS
+    return value
+
+
+def select_top_k(
+    items: Iterable[ContentItem],
+    k: int,
+    quotas: Optional[Dict[str, int]] = None,
+    weights: Optional[Dict[str, float]] = None,
+    half_life_hours: float = 24.0,
+    now: Optional[float] = None,
+) -> List[ContentItem]:
+    """The ``k`` best-scoring items, at most ``quotas[category]`` from each category.
+
+    A weight of 0 excludes a category. Ties keep fetch order, so the result is
+    deterministic for the same input. Items are returned best first.
+    """
+    quotas = DEFAULT_QUOTAS if quotas is None else quotas
+    now = now or time.time()
+    scored = [
+        (score(item, weights, half_life_hours, now), index, item)
+        for index, item in enumerate(items)
+        if (weights or {}).get(item.category.value, 1.0) > 0
+    ]
+    scored.sort(key=lambda entry: (-entry[0], entry[1]))
+
+    chosen: List[int] = []
+    counts: Dict[str, int] = {}
+
+    def take(position: int) -> None:
+        chosen.append(position)
+        category = scored[position][2].category.value
+        counts[category] = counts.get(category, 0) + 1
+
+    for category in ALWAYS_INCLUDE:
+        best = next((p for p, (_, _, item) in enumerate(scored) if item.category.value == category), None)
+        if best is not None and len(chosen) < k:
+            take(best)
+
+    for position, (_, _, item) in enumerate(scored):
+        if len(chosen) >= k:
+            break
+        category = item.category.value
+        if position in chosen or counts.get(category, 0) >= quotas.get(category, k):
+            continue
+        take(position)
+
+    return [scored[position][2] for position in sorted(chosen)]
+
+
+def rank_for_prompt(items: Iterable[ContentItem], weights: Optional[Dict[str, float]] = None) -> List[ContentItem]:
+    """Select the configured top-K items for a prompt, with optional per-user category weights."""
+    k = config('fetchers.ranking.top_k')
+    items = list(items)
+    if k <= 0:
+        return items
+    return select_top_k(
+        items,
+        k,
+        quotas={**DEFAULT_QUOTAS, **config('fetchers.ranking.quotas')},
+        weights=weights,
+        half_life_hours=config('fetchers.ranking.half_life_hours'),
+    )
@@ -0,0 +1,66 @@
+"""Background refresh of fetchers ahead of their cache expiry."""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List
+
+from app.fetchers.base import BaseFetcher
+from config import config
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundRefresher:
+    """Keeps every fetcher's cache warm so callers never wait on the network.
+
+    Each fetcher gets one task that sleeps until shortly before its result
+    expires and then refreshes it. Failed refreshes, including a first fetch
+    with nothing to serve, keep any usable earlier result (see
+    ``BaseFetcher.refresh``) and are retried after a back-off.
+    """
+
+    def __init__(self, fetchers: List[BaseFetcher]):
+        self.fetchers = fetchers
+        self.lead_seconds = config("fetchers.refresh_lead_seconds")
+        self.retry_seconds = config("fetchers.refresh_retry_seconds")
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def start(self) -> None:
+        for fetcher in self.fetchers:
+            if fetcher.name not in self._tasks:
+                self._tasks[fetcher.name] = asyncio.create_task(
+                    self._run(fetcher), name=f"refresh:{fetcher.name}"
+                )
+        logger.info(f"Background refresh started for {[f.name for f in self.fetchers]}")
+
+    async def stop(self) -> None:
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._tasks.clear()
+
+    def _lead(self, fetcher: BaseFetcher) -> float:
+        return min(self.lead_seconds, fetcher.cache_ttl_seconds * 0.1)
+
+    async def _run(self, fetcher: BaseFetcher) -> None:
+        await fetcher.restore()
+
+        while True:
+            lead = self._lead(fetcher)
+            # Cold fetchers (expires_at == 0) refresh straight away
+            await asyncio.sleep(max(fetcher.expires_at - lead - time.time(), 0))
+
+            try:
+                ok = await asyncio.wait_for(
+                    fetcher.refresh(if_expiring_within=lead),
+                    timeout=fetcher.fetch_timeout_seconds,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Background refresh of '{fetcher.name}' failed: {e!r}")
+                ok = False
+
+            if not ok:
+                await asyncio.sleep(self.retry_seconds)
@@ -0,0 +1,43 @@
+"""Immutable content snapshots shared by every message built in a refresh window."""
+
+import hashlib
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Tuple
+
+from app.fetchers.base import ContentItem
+
+
+def content_version(items: Iterable[ContentItem]) -> str:
+    """Short hash identifying a set of items; identical content gives the same version."""
+    digest = hashlib.sha1()
+    for item in items:
+        digest.update(item.content_hash.encode())
+    return digest.hexdigest()[:12]
+
+
+@dataclass(frozen=True)
+class ContentSnapshot:
+    """Fetched items and their prompt formatting, built once and reused until it expires."""
+    items: Tuple[ContentItem, ...]
+    formatted: str
+    version: str
+    created_at: float = field(default_factory=time.time)
+    expires_at: float = 0.0
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def similarity(self, other: "ContentSnapshot") -> float:
+        """Jaccard similarity (0.0-1.0) of the two snapshots' stories, ignoring
+        time-sensitive items such as weather whose wording changes every refresh."""
+        if self.version == other.version:
+            return 1.0
+
+        def keys(snapshot: "ContentSnapshot") -> set:
+            return {(item.source, item.title) for item in snapshot.items if not item.is_time_sensitive}
+
+        ours, theirs = keys(self), keys(other)
+        if not ours and not theirs:
+            return 1.0
+        return len(ours & theirs) / len(ours | theirs)
@@ -1,11 +1,8 @@
 """Tech/AI news fetcher using Hacker News RSS."""
 
 import logging
-from functools import lru_cache
 from typing import List
 
-import feedparser
-
 from app.fetchers.base import BaseFetcher, ContentCategory, ContentItem
 
 logger = logging.getLogger(__name__)
@@ -29,39 +26,34 @@ class TechNewsFetcher(BaseFetcher):
     AI_KEYWORDS = ["ai", "llm", "gpt", "claude", "openai", "anthropic", "machine learning",
                    "neural", "transformer", "chatbot", "language model"]
 
-    async def fetch(self) -> List[ContentItem]:
+    async def _fetch(self) -> List[ContentItem]:
         """Fetch tech news."""
-        return self._fetch_cached(self._ttl_hash())
-
-    @lru_cache(maxsize=1)
-    def _fetch_cached(self, ttl_hash: int) -> List[ContentItem]:
         items: List[ContentItem] = []
 
         for url in self.RSS_URLS:
-            try:
-                feed = feedparser.parse(url)
-
-                for entry in feed.entries:
-                    if len(items) >= self.max_items:
-                        break
-
-                    title = entry.get("title", "")
-                    link = entry.get("link", "")
-
-                    # Calculate relevance based on AI keywords
-                    title_lower = title.lower()
-                    is_ai_related = any(kw in title_lower for kw in self.AI_KEYWORDS)
-                    relevance = 0.95 if is_ai_related else 0.75
-
-                    items.append(ContentItem(
-                        title=title,
-                        category=self.category,
-                        source="Hacker News",
-                        relevance_score=relevance
-                    ))
-            except Exception as e:
-                logger.error(f"Tech news fetch failed for {url}: {e}")
+            items.extend(await self._fetch_feed(url, self._build_items))
 
         # Sort by relevance, AI-related first
         items.sort(key=lambda x: x.relevance_score, reverse=True)
         return items[:self.max_items]
+
+    def _build_items(self, feed) -> List[ContentItem]:
+        items: List[ContentItem] = []
+
+        for entry in feed.entries[:self.max_items]:
+            title = entry.get("title", "")
+
+            # Calculate relevance based on AI keywords
+            title_lower = title.lower()
+            is_ai_related = any(kw in title_lower for kw in self.AI_KEYWORDS)
+            relevance = 0.95 if is_ai_related else 0.75
+
+            items.append(ContentItem(
+                title=title,
+                category=self.category,
+                source="Hacker News",
+                relevance_score=relevance,
+                published_at=self._published_at(entry),
+            ))
+
+        return items
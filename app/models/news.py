@@ -1,26 +1,26 @@
-import time
-from functools import lru_cache
 from typing import List
 
 from markdownify import markdownify as md
 from pygooglenews import GoogleNews
 import asyncio
 
+from app.fetchers.base import TTLCache
+
 class News:
 
+    _cache: TTLCache[str, List[tuple]] = TTLCache(ttl_seconds=3600)
+
     @staticmethod
     async def fetch() -> List[tuple]:
-        return News.fetch_and_cache(News.set_ttl())
+        return News.fetch_and_cache()
 
     @staticmethod
-    @lru_cache
-    def fetch_and_cache(ttl=None) -> List[tuple]:
-        gn = GoogleNews(lang='en', country='GB')
-        top_news = gn.top_news()
-        articles = top_news['entries']
+    def fetch_and_cache() -> List[tuple]:
+        articles = News._cache.get("top_news")
+        if articles is None:
+            gn = GoogleNews(lang='en', country='GB')
+            top_news = gn.top_news()
+            articles = [(article['title'], md(article['summary'], strip=['a'])) for article in top_news['entries']]
+            News._cache.set("top_news", articles)
 
-        return [(article['title'], md(article['summary'], strip=['a'])) for article in articles]
-
-    @staticmethod
-    def set_ttl(seconds=3600):
-        return round(time.time() / seconds)
+        return articles
@@ -0,0 +1,32 @@
+"""LLM agent backends, selected by ``LLM_SERVICE``."""
+
+import logging
+from typing import List
+
+from app.services.agents.agent import Agent
+from config import config
+
+logger = logging.getLogger(__name__)
+
+
+def _create_backends(service: str) -> List[Agent]:
+    if service == "ollama":
+        from app.services.agents.ollama_agent import OllamaAgent
+        return [OllamaAgent()]
+    if service == "openai":
+        from app.services.agents.openai_agent import OpenAIAgent
+        return [OpenAIAgent(base_url) for base_url in config("services.openai.base_urls")]
+    raise ValueError(f"Unknown LLM service: {service}")
+
+
+def create_agent() -> Agent:
+    """Build the configured backend, or a router over several of them."""
+    backends = [backend for service in config("services.llm.backends") for backend in _create_backends(service)]
+    if not backends:
+        raise ValueError("No LLM service configured (LLM_SERVICE)")
+    if len(backends) == 1:
+        return backends[0]
+
+    from app.services.agents.router import AgentRouter
+    logger.info(f"Routing between LLM backends: {[backend.name for backend in backends]}")
+    return AgentRouter(backends)
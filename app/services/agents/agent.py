@@ -1,7 +1,122 @@
+import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional
+
+from app.services.agents.context import ContextBuilder
+from config import config
+
+logger = logging.getLogger(__name__)
 
 
 class Agent(ABC):
+    """An async LLM backend.
+
+    Subclasses implement ``_stream`` for their API and ``check_health``;
+    prompt building, reply clean-up and background health checks are shared.
+    """
+
+    SYSTEM_PROMPT = """You are GoodScoop, a friendly and witty personal assistant crafting daily updates for Jamie, a close friend.
+
+Your updates draw from multiple sources:
+- Local Newcastle news (Chronicle Live) - Jamie lives in Newcastle
+- Weather forecast - practical daily info
+- Newcastle University news - relevant to Jamie's PhD
+- Freeman Hospital/NHS news - Jamie's wife works there as a paeds ICU nurse
+- Tech and AI news - Jamie's interest area
+- Calendar events and bank holidays
+- Historical "on this day" facts
+- UK and world news
+
+Your tone is casual, warm, and playful. Make messages feel human and enjoyable - like a friend giving a quick catch-up over coffee. Be concise but informative."""
+
+    def __init__(self, name: str, model: str):
+        self.name = name
+        self.model = model
+        self.context = ContextBuilder(
+            max_tokens=config("services.llm.context_tokens"),
+            reserve_tokens=config("services.llm.response_tokens"),
+        )
+
+        # Last known server state: None until the first check or request
+        self.healthy: Optional[bool] = None
+        self.checked_at: Optional[float] = None
+        self._health_task: Optional[asyncio.Task] = None
+
+    async def chat(self, message: str) -> str:
+        messages = self._messages(message)
+
+        reply = "".join([chunk async for chunk in self._stream(messages, hold_leading_text=True)])
+
+        return reply.strip().strip('\'"')
+
+    async def chat_with_history(self, message: str, history: list[dict], content: Optional[str] = None) -> str:
+        """Chat with conversation history context, plus any fetched content the message needs."""
+        messages = self._messages(message, history, content)
+
+        reply = "".join([chunk async for chunk in self._stream(messages, hold_leading_text=True)])
+
+        return reply.strip().strip('\'"')
+
+    async def chat_stream(
+        self, message: str, history: Optional[list[dict]] = None, content: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Stream the visible reply as it is generated, skipping any reasoning."""
+        messages = self._messages(message, history, content)
+
+        async for chunk in self._stream(messages):
+            yield chunk
+
+    async def warm_up(self, prefix: Optional[str] = None) -> None:
+        """Prepare the backend ahead of real requests; a no-op unless overridden."""
+        pass
+
+    @abstractmethod
+    async def check_health(self) -> bool:
+        """Probe the backend and cache whether it is available."""
+        pass
+
     @abstractmethod
-    def chat(self, message: str) -> str:
+    def _stream(self, messages: list[dict], hold_leading_text: bool = False) -> AsyncIterator[str]:
+        """Stream the visible reply text for a list of chat messages.
+
+        ``hold_leading_text`` is passed to the ``ReasoningFilter``, for callers that buffer the whole reply.
+        """
         pass
+
+    def _messages(
+        self, message: str, history: Optional[list[dict]] = None, content: Optional[str] = None
+    ) -> list[dict]:
+        """Fit the system prompt, history and content into the context budget."""
+        context = self.context.build(self.SYSTEM_PROMPT, message, history, content)
+        logger.info(f"Prompt for {self.name} ({self.model}): {context.describe()}")
+        return context.messages
+
+    def start_health_checks(self, interval_seconds: float) -> None:
+        """Re-check the backend in the background every ``interval_seconds``."""
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._check_health_forever(interval_seconds))
+
+    async def stop_health_checks(self) -> None:
+        task, self._health_task = self._health_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _check_health_forever(self, interval_seconds: float) -> None:
+        while True:
+            await self.check_health()
+            await asyncio.sleep(interval_seconds)
+
+    def _set_health(self, healthy: bool) -> None:
+        if healthy != self.healthy:
+            if healthy:
+                logger.info(f"LLM backend {self.name} is available using model {self.model}")
+            else:
+                logger.warning(f"LLM backend {self.name} is unavailable")
+        self.healthy = healthy
+        self.checked_at = time.time()
@@ -0,0 +1,150 @@
+"""Fits chat history and fetched content into a prompt token budget."""
+
+import logging
+from dataclasses import dataclass
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Chat templates add a few tokens of role markup around every message
+MESSAGE_OVERHEAD_TOKENS = 4
+SUMMARY_TURN_CHARS = 120
+SUMMARY_MAX_TOKENS = 256
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate: roughly four characters per token for English text."""
+    return (len(text) + 3) // 4
+
+
+def _message_tokens(message: dict) -> int:
+    return estimate_tokens(message["content"]) + MESSAGE_OVERHEAD_TOKENS
+
+
+@dataclass
+class PromptContext:
+    """The messages to send, and how they were fitted to the budget."""
+    messages: List[dict]
+    prompt_tokens: int
+    history_messages: int
+    dropped_messages: int = 0
+    content_truncated: bool = False
+
+    def describe(self) -> str:
+        details = f"{self.history_messages} history messages"
+        if self.dropped_messages:
+            details += f", {self.dropped_messages} older summarised"
+        if self.content_truncated:
+            details += ", content truncated"
+        return f"~{self.prompt_tokens} prompt tokens ({details})"
+
+
+class ContextBuilder:
+    """Builds chat messages within ``max_tokens``, leaving room for the reply.
+
+    The system prompt and the new message are always kept. Fetched content
+    comes next and is cut line by line if it doesn't fit, then history is
+    filled newest first. Turns that no longer fit are folded into a short
+    summary so the model keeps the gist of the conversation.
+    """
+
+    def __init__(self, max_tokens: int = 4096, reserve_tokens: int = 1024):
+        self.max_tokens = max_tokens
+        self.reserve_tokens = reserve_tokens
+
+    @property
+    def budget(self) -> int:
+        return max(self.max_tokens - self.reserve_tokens, 0)
+
+    def build(
+        self,
+        system_prompt: str,
+        message: str,
+        history: Optional[List[dict]] = None,
+        content: Optional[str] = None,
+    ) -> PromptContext:
+        system = {"role": "system", "content": system_prompt}
+        remaining = self.budget - _message_tokens(system) - _message_tokens({"content": message})
+
+        content_truncated = False
+        if content:
+            content, content_truncated = self._fit_content(content, remaining)
+            remaining -= estimate_tokens(content)
+            message = f"{message}\n\nCurrent data available:\n{content}"
+
+        kept: List[dict] = []
+        history = history or []
+
+        # If older turns will be dropped, set aside room to summarise them
+        summary_allowance = 0
+        if sum(_message_tokens(turn) for turn in history) > remaining:
+            summary_allowance = min(max(remaining, 0) // 4, SUMMARY_MAX_TOKENS)
+            remaining -= summary_allowance
+
+        for turn in reversed(history):
+            cost = _message_tokens(turn)
+            if cost > remaining:
+                break
+            kept.append(turn)
+            remaining -= cost
+        kept.reverse()
+
+        dropped = history[:len(history) - len(kept)]
+        messages = [system]
+        if dropped:
+            summary = self._summarise(dropped, remaining + summary_allowance)
+            if summary:
+                messages.append(summary)
+
+        messages.extend(kept)
+        messages.append({"role": "user", "content": message})
+
+        context = PromptContext(
+            messages=messages,
+            prompt_tokens=sum(_message_tokens(m) for m in messages),
+            history_messages=len(kept),
+            dropped_messages=len(dropped),
+            content_truncated=content_truncated,
+        )
+        if context.prompt_tokens > self.budget:
+            logger.warning(f"Prompt exceeds the {self.budget} token budget: {context.describe()}")
+        return context
+
+    @staticmethod
+    def _fit_content(content: str, budget: int) -> tuple[str, bool]:
+        """Keep whole lines from the start of ``content`` until the budget runs out."""
+        if estimate_tokens(content) <= budget:
+            return content, False
+
+        lines = []
+        used = 0
+        for line in content.splitlines():
+            cost = estimate_tokens(line) + 1
+            if used + cost > budget:
+                break
+            lines.append(line)
+            used += cost
+        return "\n".join(lines), True
+
+    @staticmethod
+    def _summarise(turns: List[dict], budget: int) -> Optional[dict]:
+        """Condense dropped turns to their opening lines, most recent kept first if space is short."""
+        header = "Summary of earlier conversation:"
+        remaining = budget - MESSAGE_OVERHEAD_TOKENS - estimate_tokens(header)
+
+        lines = []
+        for turn in reversed(turns):
+            text = " ".join(turn["content"].split())
+            if len(text) > SUMMARY_TURN_CHARS:
+                text = text[:SUMMARY_TURN_CHARS].rstrip() + "..."
+            line = f"- {turn['role']}: {text}"
+            cost = estimate_tokens(line) + 1
+            if cost > remaining:
+                break
+            lines.append(line)
+            remaining -= cost
+
+        if not lines:
+            return None
+        lines.reverse()
+        return {"role": "system", "content": "\n".join([header, *lines])}
@@ -1,81 +1,142 @@
 import logging
+import time
 
-from ollama import AsyncClient
+from typing import AsyncIterator, Optional
+
+from ollama import AsyncClient, ResponseError
 import httpx
 
+from app.services import metrics
 from app.services.agents.agent import Agent
+from app.services.agents.reasoning import THINK_CLOSE, THINK_OPEN, ReasoningFilter
+from app.services.http import get_http_client, get_http_transport
 from config import config
 
 logger = logging.getLogger(__name__)
 
-
 class OllamaAgent(Agent):
-    def __init__(self):
-        host = config("services.ollama.host")
-        model = config("services.ollama.model")
-        logger.info(f"Connecting to {host} using model {model}")
-
-        # Get request to host and assert response is 200, "Ollama is running"
-        response = httpx.get(host)
-        response.raise_for_status()
-        assert response.text == "Ollama is running"
-        logger.info("Connected to Ollama")
-
-        self.client = AsyncClient(host=host)
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__("ollama", config("services.ollama.model"))
+        self.host = config("services.ollama.host")
+        self.http = http_client or get_http_client()
+
+        # Reuse the shared connection pool; generation can take minutes, so no read timeout
+        self.client = AsyncClient(
+            host=self.host,
+            transport=get_http_transport(),
+            timeout=httpx.Timeout(None, connect=config("http.connect_timeout")),
+        )
 
-        self.model = config("services.ollama.model")
         self.temperature = config("services.ollama.temperature")
+        self.reasoning_budget = config("services.ollama.reasoning_budget")
+        self.keep_alive = config("services.ollama.keep_alive")
+
+    async def check_health(self) -> bool:
+        """Probe the host and cache whether it is a running Ollama server."""
+        try:
+            response = await self.http.get(self.host, timeout=config("http.connect_timeout"))
+            healthy = response.status_code == 200 and response.text.strip() == "Ollama is running"
+        except httpx.HTTPError as e:
+            logger.debug(f"Ollama health check failed: {e}")
+            healthy = False
+
+        self._set_health(healthy)
+        return healthy
+
+    async def warm_up(self, prefix: Optional[str] = None) -> None:
+        """Load the model and process the system prompt (and optional prompt prefix) ahead of real requests.
+
+        Ollama reuses the cached prefix of the previous prompt, so later calls
+        that start the same way skip reprocessing it.
+        """
+        messages = [{"role": "system", "content": self.SYSTEM_PROMPT}]
+        if prefix:
+            messages.append({"role": "user", "content": prefix})
 
-    SYSTEM_PROMPT = """You are GoodScoop, a friendly and witty personal assistant crafting daily updates for Jamie, a close friend.
-
-Your updates draw from multiple sources:
-- Local Newcastle news (Chronicle Live) - Jamie lives in Newcastle
-- Weather forecast - practical daily info
-- Newcastle University news - relevant to Jamie's PhD
-- Freeman Hospital/NHS news - Jamie's wife works there as a paeds ICU nurse
-- Tech and AI news - Jamie's interest area
-- Calendar events and bank holidays
-- Historical "on this day" facts
-- UK and world news
-
-Your tone is casual, warm, and playful. Make messages feel human and enjoyable - like a friend giving a quick catch-up over coffee. Be concise but informative."""
-
-    async def chat(self, message: str) -> str:
-        response = await self.client.chat(
+        started = time.monotonic()
+        await self.client.chat(
             model=self.model,
-            messages=[
-                {"role": "system", "content": self.SYSTEM_PROMPT},
-                {"role": "user", "content": message}
-            ],
-            tools=None,
+            messages=messages,
             stream=False,
-            options={"temperature": self.temperature},
+            keep_alive=self.keep_alive,
+            options={"temperature": self.temperature, "num_predict": 1},
         )
-
-        reply = response["message"]["content"]
-
-        reply = reply.strip('\'"')
-
-        return reply
-
-    async def chat_with_history(self, message: str, history: list[dict]) -> str:
-        """Chat with conversation history context."""
-        messages = [{"role": "system", "content": self.SYSTEM_PROMPT}]
-        messages.extend(history)
-        messages.append({"role": "user", "content": message})
-
-        response = await self.client.chat(
+        logger.info(f"Warmed up {self.model} in {time.monotonic() - started:.1f}s")
+
+    async def _stream(
+        self, messages: list[dict], hold_leading_text: bool = False, enforce_budget: bool = True
+    ) -> AsyncIterator[str]:
+        """Stream visible reply text, filtering reasoning as it arrives.
+
+        Only the visible text is ever held, so memory and time-to-first-text
+        don't depend on how long the model thinks. If the reasoning budget runs
+        out, generation is stopped and retried with an empty reasoning block
+        prefilled so the model answers directly.
+        """
+        budget = self.reasoning_budget if enforce_budget else None
+        reasoning = ReasoningFilter(max_reasoning_tokens=budget, hold_leading_text=hold_leading_text)
+
+        # No up-front probe: each request updates the cached health from its own outcome.
+        # With stream=True nothing is sent until the stream is iterated, so that's where it fails.
+        started = time.monotonic()
+        stream = await self.client.chat(
             model=self.model,
             messages=messages,
             tools=None,
-            stream=False,
+            stream=True,
+            keep_alive=self.keep_alive,
             options={"temperature": self.temperature},
         )
 
-        reply = response["message"]["content"]
-
-        # Strip DeepSeek R1 thinking tags if present
-        if "</think>" in reply:
-            reply = reply.split("</think>")[1]
-
-        return reply.strip().strip('\'"')
+        parts = 0
+        final = None
+        try:
+            async for part in stream:
+                if not parts:
+                    self._set_health(True)
+                parts += 1
+                if part.get("done"):
+                    final = part
+                visible = reasoning.feed(part["message"]["content"])
+                if visible:
+                    yield visible
+                if reasoning.budget_exceeded:
+                    break
+        except (ConnectionError, httpx.TransportError):
+            self._set_health(False)
+            raise
+        except ResponseError as e:
+            if e.status_code >= 500:
+                self._set_health(False)
+            raise
+        finally:
+            await stream.aclose()
+            self._record(time.monotonic() - started, parts, final)
+
+        if not reasoning.budget_exceeded:
+            rest = reasoning.flush()
+            if rest:
+                yield rest
+            return
+
+        logger.info(f"Reasoning exceeded {budget} tokens, asking for a direct answer")
+        prefill = {"role": "assistant", "content": f"{THINK_OPEN}\n\n{THINK_CLOSE}\n\n"}
+        async for chunk in self._stream([*messages, prefill], hold_leading_text, enforce_budget=False):
+            yield chunk
+
+    def _record(self, seconds: float, parts: int, final) -> None:
+        """Record generation metrics, preferring Ollama's own counts from the final part."""
+        if final is None:
+            # Stopped early; Ollama streams about one token per part
+            metrics.record_generation(self.name, seconds, 0, parts)
+            return
+
+        eval_seconds = (final.get("eval_duration") or 0) / 1e9
+        completion_tokens = final.get("eval_count") or parts
+        metrics.record_generation(
+            self.name,
+            seconds,
+            final.get("prompt_eval_count") or 0,
+            completion_tokens,
+            tokens_per_second=completion_tokens / eval_seconds if eval_seconds else None,
+        )
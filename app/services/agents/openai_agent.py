@@ -0,0 +1,123 @@
+import json
+import logging
+import time
+
+from typing import AsyncIterator, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from app.services import metrics
+from app.services.agents.agent import Agent
+from app.services.agents.reasoning import ReasoningFilter
+from app.services.http import get_http_client
+from config import config
+
+logger = logging.getLogger(__name__)
+
+class OpenAIAgent(Agent):
+    """Chat completions against an OpenAI-compatible server such as llama.cpp or vLLM."""
+
+    def __init__(self, base_url: str, name: Optional[str] = None, http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(name or f"openai@{urlparse(base_url).netloc}", config("services.openai.model"))
+        self.base_url = base_url.rstrip("/")
+        self.http = http_client or get_http_client()
+        self.temperature = config("services.openai.temperature")
+
+        api_key = config("services.openai.api_key")
+        self.headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+
+    async def check_health(self) -> bool:
+        """Probe the server's model list and cache whether it answered."""
+        try:
+            response = await self.http.get(
+                f"{self.base_url}/models", headers=self.headers, timeout=config("http.connect_timeout")
+            )
+            healthy = response.status_code == 200
+        except httpx.HTTPError as e:
+            logger.debug(f"{self.name} health check failed: {e}")
+            healthy = False
+
+        self._set_health(healthy)
+        return healthy
+
+    async def warm_up(self, prefix: Optional[str] = None) -> None:
+        """Load the model and process the system prompt (and optional prompt prefix) ahead of real requests."""
+        messages = [{"role": "system", "content": self.SYSTEM_PROMPT}]
+        if prefix:
+            messages.append({"role": "user", "content": prefix})
+
+        started = time.monotonic()
+        response = await self.http.post(
+            f"{self.base_url}/chat/completions",
+            headers=self.headers,
+            json={"model": self.model, "messages": messages, "max_tokens": 1},
+            timeout=httpx.Timeout(None, connect=config("http.connect_timeout")),
+        )
+        response.raise_for_status()
+        logger.info(f"Warmed up {self.name} in {time.monotonic() - started:.1f}s")
+
+    async def _stream(self, messages: list[dict], hold_leading_text: bool = False) -> AsyncIterator[str]:
+        """Stream visible reply text from server-sent events, filtering reasoning as it arrives."""
+        reasoning = ReasoningFilter(hold_leading_text=hold_leading_text)
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+            "temperature": self.temperature,
+        }
+
+        # Generation can take minutes, so no read timeout
+        request = self.http.build_request(
+            "POST",
+            f"{self.base_url}/chat/completions",
+            headers=self.headers,
+            json=payload,
+            timeout=httpx.Timeout(None, connect=config("http.connect_timeout")),
+        )
+        started = time.monotonic()
+        try:
+            response = await self.http.send(request, stream=True)
+        except httpx.TransportError:
+            self._set_health(False)
+            raise
+
+        chunks = 0
+        usage = None
+        try:
+            if response.status_code >= 500:
+                self._set_health(False)
+            response.raise_for_status()
+            self._set_health(True)
+
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+
+                event = json.loads(data)
+                usage = event.get("usage") or usage
+                choices = event.get("choices") or []
+                delta = choices[0].get("delta", {}) if choices else {}
+                if delta.get("content"):
+                    chunks += 1
+                # Servers that split out reasoning send it separately; only content is shown
+                visible = reasoning.feed(delta.get("content") or "")
+                if visible:
+                    yield visible
+        finally:
+            await response.aclose()
+            # Servers that don't report usage stream roughly one token per chunk
+            metrics.record_generation(
+                self.name,
+                time.monotonic() - started,
+                (usage or {}).get("prompt_tokens", 0),
+                (usage or {}).get("completion_tokens", chunks),
+            )
+
+        rest = reasoning.flush()
+        if rest:
+            yield rest
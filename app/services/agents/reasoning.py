@@ -0,0 +1,114 @@
+"""Incremental removal of model reasoning (<think>...</think>) from token streams."""
+
+from typing import Optional
+
+THINK_OPEN = "<think>"
+THINK_CLOSE = "</think>"
+
+
+def _partial_tag_length(text: str, *tags: str) -> int:
+    """Length of the longest suffix of ``text`` that could be the start of a tag."""
+    longest = 0
+    for tag in tags:
+        for size in range(min(len(tag) - 1, len(text)), longest, -1):
+            if tag.startswith(text[-size:]):
+                longest = size
+                break
+    return longest
+
+
+class ReasoningFilter:
+    """Feeds on streamed chunks and returns only the text outside reasoning blocks.
+
+    Handles any number of ``<think>`` blocks anywhere in the reply and tags split
+    across chunks. Only a possible partial tag is held back, so memory doesn't
+    grow with the length of the reasoning.
+
+    Some chat templates open the reasoning block themselves, so the reply starts
+    with reasoning and only a closing tag. Text before such a leading ``</think>``
+    is dropped if it hasn't been returned yet; with ``hold_leading_text`` (for
+    callers that want the whole reply anyway) nothing is returned until the first
+    tag or the end of the stream, so it is always dropped. A stray closing tag
+    after visible text is removed on its own.
+
+    ``max_reasoning_tokens`` sets a budget (counted in streamed chunks, which
+    Ollama sends one token at a time); ``budget_exceeded`` lets the caller stop
+    generation early.
+    """
+
+    def __init__(self, max_reasoning_tokens: Optional[int] = None, hold_leading_text: bool = False):
+        self.max_reasoning_tokens = max_reasoning_tokens
+        self.hold_leading_text = hold_leading_text
+        self.reasoning_tokens = 0
+        self._in_reasoning = False
+        self._leading = True  # No tag or visible text yet, so a closing tag ends reasoning
+        self._held = ""
+        self._buffer = ""
+
+    @property
+    def budget_exceeded(self) -> bool:
+        return (
+            self.max_reasoning_tokens is not None
+            and self._in_reasoning
+            and self.reasoning_tokens > self.max_reasoning_tokens
+        )
+
+    def feed(self, chunk: str) -> str:
+        """Consume the next chunk, returning any text that is now known to be visible."""
+        was_reasoning = self._in_reasoning
+        buffer = self._buffer + chunk
+        visible = []
+
+        while buffer:
+            if self._in_reasoning:
+                end = buffer.find(THINK_CLOSE)
+                if end == -1:
+                    keep = _partial_tag_length(buffer, THINK_CLOSE)
+                    buffer = buffer[len(buffer) - keep:]
+                    break
+                buffer = buffer[end + len(THINK_CLOSE):]
+                self._in_reasoning = False
+                continue
+
+            start = buffer.find(THINK_OPEN)
+            stray = buffer.find(THINK_CLOSE)
+            if stray != -1 and (start == -1 or stray < start):
+                if self._leading:
+                    visible.clear()
+                    self._held = ""
+                else:
+                    visible.append(buffer[:stray])
+                buffer = buffer[stray + len(THINK_CLOSE):]
+                self._leading = False
+                continue
+            if start == -1:
+                keep = _partial_tag_length(buffer, THINK_OPEN, THINK_CLOSE)
+                visible.append(buffer[:len(buffer) - keep])
+                buffer = buffer[len(buffer) - keep:]
+                break
+            visible.append(buffer[:start])
+            buffer = buffer[start + len(THINK_OPEN):]
+            self._in_reasoning = True
+            self._leading = False
+
+        self._buffer = buffer
+        if was_reasoning or self._in_reasoning:
+            self.reasoning_tokens += 1
+
+        text = "".join(visible)
+        if self._leading and self.hold_leading_text:
+            self._held += text
+            return ""
+        text, self._held = self._held + text, ""
+        if text.strip():
+            self._leading = False
+        return text
+
+    def flush(self) -> str:
+        """Return held-back text once the stream has ended."""
+        buffer, self._buffer = self._buffer, ""
+        held, self._held = self._held, ""
+        if self._in_reasoning:
+            return ""
+        return held + buffer
+
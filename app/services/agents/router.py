@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import time
+
+from typing import AsyncIterator, Dict, List, Optional
+
+from app.services.agents.agent import Agent
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest sample in each backend's moving average latency
+LATENCY_SMOOTHING = 0.3
+
+
+class AgentRouter(Agent):
+    """Routes each request to the fastest available backend, failing over on errors.
+
+    Backends known to be down are tried last. Among the rest, ones without a
+    latency sample yet keep their configured order ahead of measured ones, so
+    every backend gets measured; after that the lowest moving-average time to
+    first text wins. A backend that fails before producing any text is marked
+    unhealthy and the next one is tried; failures mid-reply are raised, since
+    text has already been sent.
+    """
+
+    def __init__(self, backends: List[Agent]):
+        super().__init__("router", ", ".join(backend.name for backend in backends))
+        self.backends = backends
+        self.latency: Dict[str, Optional[float]] = {backend.name: None for backend in backends}
+
+    def candidates(self) -> List[Agent]:
+        """Backends in the order they should be tried."""
+        return sorted(
+            self.backends,
+            key=lambda backend: (backend.healthy is False, self.latency[backend.name] or 0.0),
+        )
+
+    async def check_health(self) -> bool:
+        results = await asyncio.gather(*(backend.check_health() for backend in self.backends))
+        healthy = any(results)
+        self._set_health(healthy)
+        return healthy
+
+    def start_health_checks(self, interval_seconds: float) -> None:
+        for backend in self.backends:
+            backend.start_health_checks(interval_seconds)
+
+    async def stop_health_checks(self) -> None:
+        await asyncio.gather(*(backend.stop_health_checks() for backend in self.backends))
+
+    async def warm_up(self, prefix: Optional[str] = None) -> None:
+        results = await asyncio.gather(
+            *(backend.warm_up(prefix) for backend in self.backends), return_exceptions=True
+        )
+        for backend, result in zip(self.backends, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Warm-up failed for {backend.name}: {result}")
+
+    async def _stream(self, messages: list[dict], hold_leading_text: bool = False) -> AsyncIterator[str]:
+        error: Optional[Exception] = None
+        for backend in self.candidates():
+            started = time.monotonic()
+            produced = False
+            try:
+                async for chunk in backend._stream(messages, hold_leading_text):
+                    if not produced:
+                        self._record_latency(backend, time.monotonic() - started)
+                        produced = True
+                    yield chunk
+                return
+            except Exception as e:
+                if produced:
+                    raise
+                logger.warning(f"LLM backend {backend.name} failed, trying the next: {e}")
+                backend._set_health(False)
+                error = e
+
+        raise error or RuntimeError("No LLM backends configured")
+
+    def _record_latency(self, backend: Agent, seconds: float) -> None:
+        previous = self.latency[backend.name]
+        if previous is None:
+            self.latency[backend.name] = seconds
+        else:
+            self.latency[backend.name] = LATENCY_SMOOTHING * seconds + (1 - LATENCY_SMOOTHING) * previous
+        logger.debug(f"{backend.name} first text after {seconds:.2f}s (avg {self.latency[backend.name]:.2f}s)")
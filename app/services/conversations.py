@@ -0,0 +1,199 @@
+"""Bounded per-user chat history with optional SQLite persistence."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from typing import Deque, List, Optional, Set, Tuple
+
+from app.services.sqlite import open_sqlite
+
+logger = logging.getLogger(__name__)
+
+# (role, content) - tuples are much smaller than one dict per message
+Turn = Tuple[str, str]
+
+
+class ConversationStore(ABC):
+    """Chat history per user, as a ring buffer of the most recent messages."""
+
+    def __init__(self, max_messages: int = 20):
+        self.max_messages = max_messages
+
+    @abstractmethod
+    def history(self, user_id: int) -> List[dict]:
+        """The user's recent messages, oldest first, as role/content dicts."""
+        pass
+
+    @abstractmethod
+    def append(self, user_id: int, role: str, content: str) -> None:
+        """Records a message, dropping the oldest once the buffer is full."""
+        pass
+
+    @abstractmethod
+    def clear(self, user_id: int) -> None:
+        """Forgets a user's history."""
+        pass
+
+    def flush(self) -> None:
+        """Writes any buffered changes to durable storage."""
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+
+class MemoryConversationStore(ConversationStore):
+    """Keeps history in memory, evicting the least recently active users past ``max_users``."""
+
+    def __init__(self, max_messages: int = 20, max_users: int = 1000):
+        super().__init__(max_messages)
+        self.max_users = max_users
+        self._buffers: "OrderedDict[int, Deque[Turn]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def history(self, user_id: int) -> List[dict]:
+        with self._lock:
+            buffer = self._buffer(user_id)
+            return [{"role": role, "content": content} for role, content in buffer]
+
+    def append(self, user_id: int, role: str, content: str) -> None:
+        with self._lock:
+            self._buffer(user_id).append((role, content))
+
+    def clear(self, user_id: int) -> None:
+        with self._lock:
+            self._buffers.pop(user_id, None)
+
+    def _buffer(self, user_id: int) -> Deque[Turn]:
+        """The user's buffer, marked most recently used, loading or creating it as needed."""
+        buffer = self._buffers.get(user_id)
+        if buffer is not None:
+            self._buffers.move_to_end(user_id)
+            return buffer
+
+        buffer = deque(self._load(user_id), maxlen=self.max_messages)
+        self._buffers[user_id] = buffer
+        while len(self._buffers) > self.max_users:
+            evicted_id, evicted = self._buffers.popitem(last=False)
+            self._evict(evicted_id, evicted)
+        return buffer
+
+    def _load(self, user_id: int) -> List[Turn]:
+        return []
+
+    def _evict(self, user_id: int, buffer: Deque[Turn]) -> None:
+        pass
+
+
+class SQLiteConversationStore(MemoryConversationStore):
+    """Memory-bounded history that is written behind to SQLite.
+
+    Appends only mark the user dirty; ``flush`` persists dirty buffers in one
+    transaction, and evicted users are written out before being dropped.
+    """
+
+    def __init__(self, path: str, max_messages: int = 20, max_users: int = 1000):
+        super().__init__(max_messages, max_users)
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._dirty: Set[int] = set()
+        self._deleted: Set[int] = set()
+
+    def append(self, user_id: int, role: str, content: str) -> None:
+        with self._lock:
+            super().append(user_id, role, content)
+            self._dirty.add(user_id)
+            self._deleted.discard(user_id)
+
+    def clear(self, user_id: int) -> None:
+        with self._lock:
+            super().clear(user_id)
+            self._dirty.discard(user_id)
+            self._deleted.add(user_id)
+
+    def flush(self) -> None:
+        with self._lock:
+            rows = [
+                (user_id, self._serialize(self._buffers[user_id]), time.time())
+                for user_id in self._dirty
+                if user_id in self._buffers
+            ]
+            deleted = [(user_id,) for user_id in self._deleted]
+            self._dirty.clear()
+            self._deleted.clear()
+            if not rows and not deleted:
+                return
+            try:
+                conn = self._connection()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO conversations (user_id, messages, updated_at) VALUES (?, ?, ?)",
+                    rows,
+                )
+                conn.executemany("DELETE FROM conversations WHERE user_id = ?", deleted)
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to persist conversations: {e}")
+                return
+        logger.debug(f"Persisted {len(rows)} conversations")
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _load(self, user_id: int) -> List[Turn]:
+        if user_id in self._deleted:
+            return []
+        try:
+            row = self._connection().execute(
+                "SELECT messages FROM conversations WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to load conversation for {user_id}: {e}")
+            return []
+        return [tuple(turn) for turn in json.loads(row[0])] if row else []
+
+    def _evict(self, user_id: int, buffer: Deque[Turn]) -> None:
+        if user_id not in self._dirty:
+            return
+        self._dirty.discard(user_id)
+        try:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO conversations (user_id, messages, updated_at) VALUES (?, ?, ?)",
+                (user_id, self._serialize(buffer), time.time()),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to persist evicted conversation for {user_id}: {e}")
+
+    @staticmethod
+    def _serialize(buffer: Deque[Turn]) -> str:
+        return json.dumps(list(buffer), separators=(",", ":"))
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = open_sqlite(
+                self.path,
+                "CREATE TABLE IF NOT EXISTS conversations ("
+                "user_id INTEGER PRIMARY KEY, messages TEXT NOT NULL, updated_at REAL NOT NULL)",
+            )
+        return self._conn
+
+
+def create_conversation_store(
+    path: Optional[str], max_messages: int = 20, max_users: int = 1000
+) -> ConversationStore:
+    """A SQLite-backed store when a path is configured, otherwise memory only."""
+    if path:
+        return SQLiteConversationStore(path, max_messages, max_users)
+    return MemoryConversationStore(max_messages, max_users)
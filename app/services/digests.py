@@ -0,0 +1,69 @@
+"""Daily digests generated ahead of their send time."""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from app.fetchers.base import ContentItem
+from app.fetchers.snapshot import ContentSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PreparedDigest:
+    """A generated digest, the content snapshot it was written from and the items it was given.
+
+    ``send_at`` is the Unix time of the delivery it was prepared for.
+    """
+    text: str
+    snapshot: ContentSnapshot
+    send_at: float
+    items: Tuple[ContentItem, ...] = ()
+    generated_at: float = field(default_factory=time.time)
+
+
+class DigestStore:
+    """Prepared digests by user id, each used at most once.
+
+    A digest is only valid for the send it was prepared for: ``take`` rejects
+    it once ``max_lateness_seconds`` have passed since its send time.
+    """
+
+    def __init__(self, min_similarity: float, max_lateness_seconds: float):
+        self.min_similarity = min_similarity
+        self.max_lateness_seconds = max_lateness_seconds
+        self._digests: Dict[int, PreparedDigest] = {}
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def put(self, user_id: int, digest: PreparedDigest) -> None:
+        self._digests[user_id] = digest
+
+    def discard(self, user_id: int) -> None:
+        self._digests.pop(user_id, None)
+
+    def take(self, user_id: int, current: ContentSnapshot) -> Optional[PreparedDigest]:
+        """Remove and return a user's prepared digest if it is for this send and its content is still current.
+
+        Returns None if nothing was prepared, the digest was for an earlier send,
+        or the content has changed enough that the digest should be regenerated.
+        """
+        digest = self._digests.pop(user_id, None)
+        if digest is None:
+            return None
+
+        if time.time() > digest.send_at + self.max_lateness_seconds:
+            logger.info(f"Discarding digest for {user_id} prepared for an earlier send")
+            return None
+
+        similarity = digest.snapshot.similarity(current)
+        if similarity < self.min_similarity:
+            logger.info(
+                f"Content changed since digest for {user_id} was prepared "
+                f"(similarity {similarity:.2f}), regenerating"
+            )
+            return None
+        return digest
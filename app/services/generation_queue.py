@@ -0,0 +1,141 @@
+"""Priority queue limiting concurrent LLM generations."""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from app.services import metrics
+from config import config
+
+logger = logging.getLogger(__name__)
+
+wait_seconds = metrics.registry.histogram(
+    "generation_wait_seconds", "Time spent waiting for a generation slot per priority."
+)
+
+
+class Priority(IntEnum):
+    """Lower values are served first."""
+    INTERACTIVE = 0  # A user is waiting on a chat reply
+    SCHEDULED = 1  # Daily digests
+    PREGENERATE = 2  # Digests prepared ahead of their send time
+
+
+class GenerationQueueFull(Exception):
+    """Raised when too many generations are already waiting for a slot."""
+
+
+class GenerationQueue:
+    """Hands out a fixed number of generation slots, interactive requests first.
+
+    Callers hold a slot for the whole generation (including streaming) via
+    ``async with queue.slot(priority):``. Waiters are served by priority, then
+    arrival order. Once ``max_waiting`` requests are queued, further requests
+    fail fast with ``GenerationQueueFull`` instead of piling onto the server.
+    """
+
+    def __init__(self, concurrency: int, max_waiting: int):
+        self.concurrency = max(1, concurrency)
+        self.max_waiting = max_waiting
+        self._active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+        self.served: Dict[Priority, int] = {priority: 0 for priority in Priority}
+        self.rejected: Dict[Priority, int] = {priority: 0 for priority in Priority}
+
+    @property
+    def depth(self) -> int:
+        """Requests currently waiting for a slot."""
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def is_idle(self) -> bool:
+        """Whether a new request would get a slot straight away."""
+        return self._active < self.concurrency and not self.depth
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority = Priority.INTERACTIVE) -> AsyncIterator[None]:
+        enqueued = time.monotonic()
+        await self._acquire(priority)
+        waited = time.monotonic() - enqueued
+        self._record_wait(priority, waited)
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: Priority) -> None:
+        if self._active < self.concurrency and not self.depth:
+            self._active += 1
+            return
+
+        if self.depth >= self.max_waiting:
+            self.rejected[priority] += 1
+            raise GenerationQueueFull(f"{self.depth} generations already waiting")
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release()  # The slot was handed over just as we were cancelled
+            raise
+
+    def _release(self) -> None:
+        # Hand the slot straight to the next live waiter, if any
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def _record_wait(self, priority: Priority, waited: float) -> None:
+        self.served[priority] += 1
+        wait_seconds.observe(waited, priority=priority.name.lower())
+        if waited >= 1.0:
+            logger.info(f"{priority.name.lower()} generation waited {waited:.1f}s for a slot")
+
+
+_queue: Optional[GenerationQueue] = None
+
+
+def get_generation_queue() -> GenerationQueue:
+    """Return the process-wide generation queue, configured from config/generation.py."""
+    global _queue
+    if _queue is None:
+        _queue = GenerationQueue(
+            concurrency=config("generation.concurrency"),
+            max_waiting=config("generation.max_waiting"),
+        )
+    return _queue
+
+
+def _queue_metrics() -> List[metrics.Gauge | metrics.Counter]:
+    """Queue state for the metrics endpoint, read at render time."""
+    if _queue is None:
+        return []
+    prefix = metrics.registry.prefix
+    active = metrics.Gauge(f"{prefix}_generation_active", "Generations currently running.")
+    waiting = metrics.Gauge(f"{prefix}_generation_waiting", "Generations waiting for a slot.")
+    served = metrics.Counter(f"{prefix}_generation_served_total", "Generations started per priority.")
+    active.set(_queue.active)
+    waiting.set(_queue.depth)
+    for priority, count in _queue.served.items():
+        served.inc(count, priority=priority.name.lower())
+    return [active, waiting, served]
+
+
+metrics.registry.register_collector(_queue_metrics)
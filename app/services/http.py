@@ -0,0 +1,120 @@
+"""Process-wide pooled HTTP client shared by fetchers and LLM agents."""
+
+import asyncio
+import logging
+from typing import Callable, Dict, Optional
+
+import httpx
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+_transport: Optional["PerHostLimitTransport"] = None
+_client: Optional[httpx.AsyncClient] = None
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that releases a per-host slot once the body is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class PerHostLimitTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper capping concurrent in-flight requests per host.
+
+    httpx only limits connections for the whole pool, so a burst against one
+    slow host could otherwise starve every other source.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int):
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphores.get(request.url.host)
+        if semaphore is None:
+            semaphore = self._semaphores[request.url.host] = asyncio.Semaphore(self._max_per_host)
+
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        response.stream = _ReleasingStream(response.stream, semaphore.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_http_transport() -> PerHostLimitTransport:
+    """Return the shared connection pool, creating it on first use."""
+    global _transport
+    if _transport is None:
+        http2 = config("http.http2") and _http2_available()
+        limits = httpx.Limits(
+            max_connections=config("http.max_connections"),
+            max_keepalive_connections=config("http.max_keepalive_connections"),
+            keepalive_expiry=config("http.keepalive_expiry"),
+        )
+        _transport = PerHostLimitTransport(
+            httpx.AsyncHTTPTransport(http2=http2, limits=limits),
+            max_per_host=config("http.max_connections_per_host"),
+        )
+        logger.debug(f"Created shared HTTP transport (http2={http2})")
+    return _transport
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            transport=get_http_transport(),
+            timeout=httpx.Timeout(config("http.timeout"), connect=config("http.connect_timeout")),
+            follow_redirects=True,
+            headers={"User-Agent": config("http.user_agent")},
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and its connection pool.
+
+    Clients built on top of the shared transport (e.g. the Ollama client) must
+    not be used after this.
+    """
+    global _client, _transport
+    if _client is not None:
+        await _client.aclose()  # Also closes the shared transport
+    elif _transport is not None:
+        await _transport.aclose()
+    _client = None
+    _transport = None
@@ -0,0 +1,327 @@
+"""In-process metrics with Prometheus text exposition and a human-readable summary."""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+Labels = Tuple[Tuple[str, str], ...]
+
+# Seconds; spans cached fetches and Telegram sends through to multi-minute CPU generations
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [*labels, extra] if extra else list(labels)
+    if not pairs:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def samples(self) -> Iterable[Tuple[str, Labels, Optional[Tuple[str, str]], float]]:
+        pass
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, labels, extra, value in self.samples():
+            lines.append(f"{self.name}{suffix}{_format_labels(labels, extra)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """A value that only goes up, per label set."""
+    kind = "counter"
+
+    def __init__(self, name: str, help: str):
+        super().__init__(name, help)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(_labels(labels), 0.0)
+
+    def samples(self):
+        for labels, value in sorted(self._values.items()):
+            yield "", labels, None, value
+
+
+class Gauge(_Metric):
+    """A value that can go up and down, per label set."""
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str):
+        super().__init__(name, help)
+        self._values: Dict[Labels, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[_labels(labels)] = value
+
+    def value(self, **labels: str) -> Optional[float]:
+        return self._values.get(_labels(labels))
+
+    def samples(self):
+        for labels, value in sorted(self._values.items()):
+            yield "", labels, None, value
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets, per label set."""
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket..., +Inf count], sum
+        self._values: Dict[Labels, Tuple[List[int], float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _labels(labels)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            self._values[key] = (counts, total + value)
+
+    def count(self, **labels: str) -> int:
+        entry = self._values.get(_labels(labels))
+        return sum(entry[0]) if entry else 0
+
+    def quantile(self, q: float, **labels: str) -> Optional[float]:
+        """Upper bucket bound containing the ``q`` quantile (None if nothing observed)."""
+        entry = self._values.get(_labels(labels))
+        if not entry:
+            return None
+        counts = entry[0]
+        target = q * sum(counts)
+        running = 0
+        for bound, count in zip((*self.buckets, math.inf), counts):
+            running += count
+            if running >= target:
+                return bound
+        return math.inf
+
+    def label_sets(self) -> List[Dict[str, str]]:
+        return [dict(labels) for labels in sorted(self._values)]
+
+    def samples(self):
+        for labels, (counts, total) in sorted(self._values.items()):
+            running = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                running += count
+                yield "_bucket", labels, ("le", _format_value(bound)), running
+            yield "_sum", labels, None, total
+            yield "_count", labels, None, running
+
+
+class MetricsRegistry:
+    """Named metrics plus collectors that contribute samples at render time."""
+
+    def __init__(self, prefix: str = "goodscoop"):
+        self.prefix = prefix
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[_Metric]]] = []
+        self._caches: Dict[str, Callable[[], Dict[str, int]]] = {}
+
+    def counter(self, name: str, help: str) -> Counter:
+        return self._get(Counter, name, help)
+
+    def gauge(self, name: str, help: str) -> Gauge:
+        return self._get(Gauge, name, help)
+
+    def histogram(self, name: str, help: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help, buckets)
+
+    def register_collector(self, collector: Callable[[], Iterable[_Metric]]) -> None:
+        """Add a callable returning freshly built metrics, for state kept elsewhere (e.g. cache stats)."""
+        self._collectors.append(collector)
+
+    def register_cache(self, name: str, stats: Callable[[], Dict[str, int]]) -> None:
+        """Report a cache's ``TTLCache.stats()``-style hit/miss counters under ``name``."""
+        self._caches[name] = stats
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        return {name: stats() for name, stats in sorted(self._caches.items())}
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        metrics = [*self._metrics.values(), *self._cache_metrics()]
+        for collector in self._collectors:
+            try:
+                metrics.extend(collector())
+            except Exception as e:
+                logger.warning(f"Metrics collector failed: {e}")
+        lines = [line for metric in metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+    def _cache_metrics(self) -> List[_Metric]:
+        lookups = Counter(f"{self.prefix}_cache_lookups_total", "Cache lookups per cache and result.")
+        entries = Gauge(f"{self.prefix}_cache_entries", "Entries held per cache.")
+        for name, stats in self.cache_stats().items():
+            for result in ("hits", "stale_hits", "misses"):
+                lookups.inc(stats.get(result, 0), cache=name, result=result)
+            entries.set(stats.get("size", 0), cache=name)
+        return [lookups, entries] if self._caches else []
+
+    def _get(self, cls, name: str, help: str, *args):
+        full_name = f"{self.prefix}_{name}"
+        metric = self._metrics.get(full_name)
+        if metric is None:
+            metric = self._metrics[full_name] = cls(full_name, help, *args)
+        elif not isinstance(metric, cls):
+            raise ValueError(f"Metric {full_name} is already registered as a {metric.kind}")
+        return metric
+
+
+registry = MetricsRegistry()
+
+fetch_seconds = registry.histogram("fetch_duration_seconds", "Upstream fetch time per fetcher.")
+fetch_results = registry.counter("fetch_results_total", "Upstream fetches per fetcher and outcome (ok, empty, error).")
+fetch_bytes = registry.counter("fetch_bytes_total", "Response bytes downloaded per fetcher.")
+fetch_not_modified = registry.counter("fetch_not_modified_total", "Conditional GETs answered 304 per fetcher.")
+llm_seconds = registry.histogram("llm_generation_seconds", "LLM generation time per backend.")
+llm_prompt_tokens = registry.counter("llm_prompt_tokens_total", "Prompt tokens processed per backend.")
+llm_completion_tokens = registry.counter("llm_completion_tokens_total", "Completion tokens generated per backend.")
+llm_tokens_per_second = registry.gauge("llm_tokens_per_second", "Completion tokens per second of the last generation.")
+telegram_seconds = registry.histogram("telegram_request_seconds", "Telegram API call latency per method.")
+
+
+def record_generation(
+    backend: str,
+    seconds: float,
+    prompt_tokens: int,
+    completion_tokens: int,
+    tokens_per_second: Optional[float] = None,
+) -> None:
+    """Record one finished LLM generation; the rate defaults to completion tokens over wall time."""
+    llm_seconds.observe(seconds, backend=backend)
+    llm_prompt_tokens.inc(prompt_tokens, backend=backend)
+    llm_completion_tokens.inc(completion_tokens, backend=backend)
+    if tokens_per_second is None and seconds > 0 and completion_tokens:
+        tokens_per_second = completion_tokens / seconds
+    if tokens_per_second is not None:
+        llm_tokens_per_second.set(tokens_per_second, backend=backend)
+
+
+async def timed(histogram: Histogram, call: Awaitable[T], **labels: str) -> T:
+    """Await ``call`` and observe how long it took, whether or not it succeeded."""
+    started = time.monotonic()
+    try:
+        return await call
+    finally:
+        histogram.observe(time.monotonic() - started, **labels)
+
+
+def summary() -> str:
+    """Short plain-text report for the /stats command."""
+    lines = ["Fetchers (p50 / p95 / fetches / errors):"]
+    for labels in fetch_seconds.label_sets():
+        name = labels["fetcher"]
+        lines.append(
+            f"- {name}: {fetch_seconds.quantile(0.5, fetcher=name):g}s / "
+            f"{fetch_seconds.quantile(0.95, fetcher=name):g}s / "
+            f"{fetch_seconds.count(fetcher=name)} / "
+            f"{fetch_results.value(fetcher=name, outcome='error'):.0f}"
+        )
+
+    lines.append("LLM (generations / p50 / tokens per second):")
+    for labels in llm_seconds.label_sets():
+        backend = labels["backend"]
+        rate = llm_tokens_per_second.value(backend=backend)
+        lines.append(
+            f"- {backend}: {llm_seconds.count(backend=backend)} / "
+            f"{llm_seconds.quantile(0.5, backend=backend):g}s / "
+            f"{rate or 0:.1f}"
+        )
+
+    caches = registry.cache_stats()
+    if caches:
+        lines.append("Caches (hits / stale / misses):")
+        for name, stats in caches.items():
+            lines.append(f"- {name}: {stats['hits']} / {stats['stale_hits']} / {stats['misses']}")
+
+    if telegram_seconds.label_sets():
+        lines.append("Telegram (calls / p95):")
+        for labels in telegram_seconds.label_sets():
+            method = labels["method"]
+            lines.append(
+                f"- {method}: {telegram_seconds.count(method=method)} / "
+                f"{telegram_seconds.quantile(0.95, method=method):g}s"
+            )
+    return "\n".join(lines)
+
+
+class MetricsServer:
+    """Minimal HTTP server answering every GET with the Prometheus text exposition."""
+
+    def __init__(self, registry: MetricsRegistry, host: str, port: int):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        logger.info(f"Serving metrics on http://{self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            while (await asyncio.wait_for(reader.readline(), timeout=5)) not in (b"\r\n", b"\n", b""):
+                pass  # Headers are ignored
+
+            if request_line.split(b" ")[0] == b"GET":
+                status, body = "200 OK", self.registry.render().encode()
+            else:
+                status, body = "405 Method Not Allowed", b""
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
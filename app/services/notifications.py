@@ -1,44 +1,140 @@
+import asyncio
 import logging
-import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Awaitable, Dict, List, TypeVar
 
-from telegram import Bot, Update
+from telegram import Bot, Message, Update
+from telegram.constants import ChatAction, MessageLimit
+from telegram.error import BadRequest, RetryAfter
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 
+from app.fetchers.base import ContentItem
+from app.fetchers.ranking import rank_for_prompt
+from app.fetchers.snapshot import ContentSnapshot
+from app.services import metrics
+from app.services.conversations import create_conversation_store
+from app.services.digests import DigestStore, PreparedDigest
+from app.services.generation_queue import GenerationQueueFull, Priority, get_generation_queue, wait_seconds
+from app.services.seen import SeenItems, covered_items
+from app.services.subscribers import Subscriber, SubscriberRegistry
 from config import config
 
 logger = logging.getLogger(__name__)
 
-class Notifications:
-    # Conversation history per user: {user_id: [{"role": "user"|"assistant", "content": "..."}]}
-    conversations: dict[int, list[dict]] = {}
+T = TypeVar("T")
 
+class Notifications:
     def __init__(self):
         self.bot = Bot(token=config('services.telegram.token'))
-        self.scheduler = BackgroundScheduler(timezone="UTC")
-        self.scheduler.start()
-        self.user_id = None  # To store the ID of the user who subscribes
-        self.user_name = None  # To store the username of the subscriber
+        # Runs coroutine jobs on the bot's own event loop; started from the post_init hook
+        self.scheduler = AsyncIOScheduler(
+            timezone="UTC",
+            job_defaults={
+                "coalesce": True,
+                "misfire_grace_time": config('scheduler.misfire_grace_seconds'),
+            },
+        )
+        self.subscribers = SubscriberRegistry(config('storage.subscribers.path'))
+        self.digests = DigestStore(
+            config('generation.pregenerate.min_similarity'),
+            # A send can run this late (misfires, catch-ups) and still be the one the digest was for
+            max_lateness_seconds=config('scheduler.misfire_grace_seconds'),
+        )
+        # Digests being generated right now, so a send that comes due waits for them
+        self._pregenerating: Dict[int, asyncio.Future] = {}
+        self.seen = SeenItems(
+            config('storage.seen_items.path'),
+            ttl_seconds=config('storage.seen_items.ttl_days') * 86400,
+            mode=config('storage.seen_items.mode'),
+            downweight=config('storage.seen_items.downweight'),
+        )
+        self.scheduler.add_job(self.seen.expire, "interval", hours=1, id="expire:seen_items")
+        self.conversations = create_conversation_store(
+            config('storage.conversations.path'),
+            max_messages=config('storage.conversations.max_messages'),
+            max_users=config('storage.conversations.max_users'),
+        )
+        self.scheduler.add_job(
+            self.conversations.flush,
+            "interval",
+            seconds=config('storage.conversations.flush_seconds'),
+            id="flush:conversations",
+        )
+
+        # The subscriber table is the persistent job store: rebuild every daily job from it
+        for subscriber in self.subscribers:
+            self.schedule_daily_message(subscriber)
 
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handles the /start command to register a user."""
-        self.user_id = update.effective_user.id
-        self.user_name = update.effective_user.first_name or update.effective_user.username
+        user_id = update.effective_user.id
+        user_name = update.effective_user.first_name or update.effective_user.username
 
-        if not self.user_name:
+        if not user_name:
             await update.message.reply_text(
                 "Welcome! I couldn't detect your name. What should I call you?"
             )
             context.user_data['awaiting_name'] = True
             return
 
-        logger.info(f"User subscribed: {self.user_name} (ID: {self.user_id})")
+        await self.subscribe(update, user_id, user_name)
+
+    async def stop(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handles the /stop command to unsubscribe a user."""
+        subscriber = self.subscribers.remove(update.effective_user.id)
+        if subscriber is None:
+            await update.message.reply_text("You're not subscribed. Send /start to subscribe.")
+            return
+
+        # Pending retries and catch-ups would otherwise still deliver after unsubscribing
+        job_ids = (
+            subscriber.job_id,
+            subscriber.pregenerate_job_id,
+            f"retry:{subscriber.user_id}",
+            f"catchup:{subscriber.user_id}",
+        )
+        for job_id in job_ids:
+            if self.scheduler.get_job(job_id):
+                self.scheduler.remove_job(job_id)
+        self.digests.discard(subscriber.user_id)
+        self.seen.forget(subscriber.user_id)
+        logger.info(f"User unsubscribed: {subscriber.name} (ID: {subscriber.user_id})")
+        await update.message.reply_text("You've unsubscribed from daily updates. Send /start to come back.")
+
+    async def stats(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handles the /stats admin command with a summary of fetcher, cache and LLM metrics."""
+        if update.effective_user.id not in config('services.telegram.admin_ids'):
+            logger.warning(f"Ignoring /stats from non-admin {update.effective_user.id}")
+            return
+
+        queue = get_generation_queue()
+        summary = metrics.summary()
+        summary += f"\nGeneration queue: {queue.active} active, {queue.depth} waiting"
+        for labels in wait_seconds.label_sets():
+            priority = labels["priority"]
+            summary += f"\n- {priority} p95 wait: {wait_seconds.quantile(0.95, priority=priority):g}s"
+        summary += f"\nSubscribers: {len(self.subscribers)}"
+        await update.message.reply_text(summary[:MessageLimit.MAX_TEXT_LENGTH])
+
+    async def subscribe(self, update: Update, user_id: int, user_name: str):
+        """Registers or updates a subscriber, sends a first message and schedules the rest."""
+        subscriber = self.subscribers.get(user_id)
+        if subscriber is None:
+            subscriber = Subscriber(user_id=user_id, name=user_name)
+        else:
+            subscriber.name = user_name  # Keep their existing delivery time
+        self.subscribers.save(subscriber)
+
+        logger.info(f"User subscribed: {user_name} (ID: {user_id})")
         await update.message.reply_text(
-            f"Hi {self.user_name}! You've subscribed to daily news updates."
+            f"Hi {user_name}! You've subscribed to daily news updates."
         )
-        await self.send_message(self.user_id)  # Trigger the first message immediately
-        self.schedule_random_daily_message()
+        self.schedule_daily_message(subscriber)
+        await self.send_message(user_id, Priority.INTERACTIVE)  # Trigger the first message immediately
 
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handles all text messages - name input or general chat."""
@@ -47,71 +143,286 @@ class Notifications:
 
         # Handle name input if awaiting
         if context.user_data.get('awaiting_name'):
-            self.user_name = user_message
             context.user_data['awaiting_name'] = False
-            logger.info(f"User provided their name: {self.user_name} (ID: {self.user_id})")
-            await update.message.reply_text(
-                f"Thanks, {self.user_name}! You've subscribed to daily notifications."
-            )
-            await self.send_message(self.user_id)
-            self.schedule_random_daily_message()
+            logger.info(f"User provided their name: {user_message} (ID: {user_id})")
+            await self.subscribe(update, user_id, user_message)
             return
 
         # Handle as chat message
         logger.info(f"Chat from {user_id}: {user_message[:50]}...")
 
-        # Get or create conversation history
-        history = self.conversations.get(user_id, [])
-
-        # Add user message to history
-        history.append({"role": "user", "content": user_message})
+        history = self.conversations.history(user_id)
+        subscriber = self.subscribers.get(user_id)
+        profile = subscriber.profile_key if subscriber else None
 
         # Generate response with history context
-        from main import chat_response
-        response = await chat_response(user_message, history[:-1])  # Exclude current message from history
-
-        # Add assistant response to history
-        history.append({"role": "assistant", "content": response})
-
-        # Trim history to last 20 messages (10 exchanges)
-        self.conversations[user_id] = history[-20:]
-
-        await update.message.reply_text(response)
-
-    def schedule_random_daily_message(self):
-        """Schedules a random daily message."""
-        if self.user_id:
-            # Cancel existing jobs for the same user if any
-            self.scheduler.remove_all_jobs()
-
-            # Schedule the next message at a random time
-            random_hour = random.randint(0, 23)
-            random_minute = random.randint(0, 59)
-            trigger = CronTrigger(hour=random_hour, minute=random_minute)
-            logger.info(
-                f"Scheduled daily message for {self.user_name} (ID: {self.user_id}) "
-                f"at {random_hour:02d}:{random_minute:02d} UTC"
-            )
+        from main import chat_response, chat_response_stream
+        try:
+            if config('services.telegram.stream_replies'):
+                await update.effective_chat.send_action(ChatAction.TYPING)
+                response = await self.stream_reply(
+                    update.message,
+                    chat_response_stream(user_message, history, profile),
+                )
+            else:
+                response = await chat_response(user_message, history, profile)
+                await self._telegram("reply_text", update.message.reply_text(response))
+        except GenerationQueueFull:
+            logger.warning(f"Generation queue full, turning away chat from {user_id}")
+            await update.message.reply_text("I'm a bit swamped right now - give me a minute and try again!")
+            return
+
+        # The store keeps only the most recent messages per user
+        self.conversations.append(user_id, "user", user_message)
+        self.conversations.append(user_id, "assistant", response)
+
+    async def stream_reply(self, message: Message, chunks: AsyncIterator[str]) -> str:
+        """Replies with a message that is edited as chunks arrive, returning the full text."""
+        interval = config('services.telegram.edit_interval')
+        limit = MessageLimit.MAX_TEXT_LENGTH
+        text = ""
+        sent_text = ""
+        reply = None
+        next_edit = 0.0
+
+        async for chunk in chunks:
+            text += chunk
+            visible = text.strip()[:limit]
+            if not visible or visible == sent_text or time.monotonic() < next_edit:
+                continue
+
+            try:
+                if reply is None:
+                    reply = await self._telegram("reply_text", message.reply_text(visible))
+                else:
+                    await self._telegram("edit_text", reply.edit_text(visible))
+                sent_text = visible
+                next_edit = time.monotonic() + interval
+            except RetryAfter as e:
+                next_edit = time.monotonic() + e.retry_after
+            except BadRequest as e:
+                logger.debug(f"Skipping streamed edit: {e}")
+
+        final = text.strip().strip('\'"')
+        if not final:
+            final = "Sorry, I couldn't come up with a reply just now."
+
+        if reply is None:
+            await self._telegram("reply_text", message.reply_text(final[:limit]))
+        elif final[:limit] != sent_text:
+            await self._telegram("edit_text", reply.edit_text(final[:limit]))
+        for start in range(limit, len(final), limit):
+            await self._telegram("reply_text", message.reply_text(final[start:start + limit]))
+
+        return final
+
+    @staticmethod
+    async def _telegram(method: str, call: Awaitable[T]) -> T:
+        """Await a Telegram API call, recording its latency under ``method``."""
+        return await metrics.timed(metrics.telegram_seconds, call, method=method)
+
+    def schedule_daily_message(self, subscriber: Subscriber):
+        """Schedules a subscriber's daily message at their delivery time."""
+        trigger = CronTrigger(hour=subscriber.hour, minute=subscriber.minute)
+        logger.info(
+            f"Scheduled daily message for {subscriber.name} (ID: {subscriber.user_id}) "
+            f"at {subscriber.hour:02d}:{subscriber.minute:02d} UTC"
+        )
+        self.scheduler.add_job(
+            self.send_message,
+            trigger,
+            kwargs={"user_id": subscriber.user_id},
+            id=subscriber.job_id,  # One job per subscriber, replaced on re-subscribe
+            replace_existing=True
+        )
+
+        if config('generation.pregenerate.enabled'):
+            # Start preparing the digest a little before it is due
+            lead = config('generation.pregenerate.lead_minutes')
+            start = (subscriber.hour * 60 + subscriber.minute - lead) % (24 * 60)
             self.scheduler.add_job(
-                self.send_message,
-                trigger,
-                kwargs={"user_id": self.user_id},
-                id=str(self.user_id),  # Job ID is the user's ID
+                self.pregenerate_message,
+                CronTrigger(hour=start // 60, minute=start % 60),
+                kwargs={"user_id": subscriber.user_id},
+                id=subscriber.pregenerate_job_id,
                 replace_existing=True
             )
 
-    async def send_message(self, user_id: int):
-        """Sends the daily message to the user."""
+    async def pregenerate_message(self, user_id: int):
+        """Prepares a subscriber's next digest once the generation queue is idle."""
+        from main import create_message
+        from app.fetchers import FetcherRegistry
+
+        subscriber = self.subscribers.get(user_id)
+        if subscriber is None:
+            return
+
+        send_at = subscriber.next_send_time()
+        queue = get_generation_queue()
+        poll = config('generation.pregenerate.poll_seconds')
+        # Leave enough time to finish before the send; otherwise it generates inline
+        deadline = send_at - timedelta(seconds=poll)
+        while not queue.is_idle:
+            if datetime.now(timezone.utc) >= deadline:
+                logger.info(f"No idle slot to prepare digest for {user_id} before {send_at:%H:%M} UTC")
+                return
+            await asyncio.sleep(poll)
+
+        done = asyncio.get_running_loop().create_future()
+        self._pregenerating[user_id] = done
+        try:
+            snapshot = await FetcherRegistry.snapshot()
+            items = self.digest_items(subscriber, snapshot)
+            try:
+                text = await create_message(subscriber.name, Priority.PREGENERATE, snapshot, send_at, items)
+            except GenerationQueueFull:
+                return
+            # Even if generation ran past the send time, the send is waiting for this digest
+            self.digests.put(user_id, PreparedDigest(text, snapshot, send_at.timestamp(), tuple(items)))
+            logger.info(f"Prepared digest for {subscriber.name} (ID: {user_id}) due at {send_at:%H:%M} UTC")
+        finally:
+            del self._pregenerating[user_id]
+            done.set_result(None)
+
+    def digest_items(self, subscriber: Subscriber, snapshot: ContentSnapshot) -> List[ContentItem]:
+        """The snapshot's best items for a subscriber, leaving out stories they've already been sent."""
+        unseen = self.seen.filter(subscriber.user_id, snapshot.items)
+        return rank_for_prompt(unseen, subscriber.preferences.get("category_weights"))
+
+    async def send_message(self, user_id: int, priority: Priority = Priority.SCHEDULED):
+        """Sends the daily message to the user, using a prepared digest if it's still current."""
         from main import create_message  # Import dynamically to get the latest content
-        message = await create_message()
-        logger.info(f"Sending message to {self.user_name} (ID: {user_id})")
-        await self.bot.send_message(chat_id=user_id, text=message)
+        from app.fetchers import FetcherRegistry
+
+        subscriber = self.subscribers.get(user_id)
+        if subscriber is None and priority is not Priority.INTERACTIVE:
+            logger.info(f"Skipping message for {user_id}, who is no longer subscribed")
+            return
+        user_name = subscriber.name if subscriber else None
+
+        pending = self._pregenerating.get(user_id)
+        if pending is not None and priority is Priority.SCHEDULED:
+            # Regenerating would queue behind it and throw its digest away
+            logger.info(f"Waiting for the digest being prepared for {user_name} (ID: {user_id})")
+            await asyncio.shield(pending)
+
+        snapshot = await FetcherRegistry.snapshot()
+        digest = None
+        if priority is Priority.SCHEDULED:
+            digest = self.digests.take(user_id, snapshot)
+        if digest is not None:
+            message, items = digest.text, digest.items
+        else:
+            self.digests.discard(user_id)  # Generating inline supersedes anything prepared
+            items = self.digest_items(subscriber, snapshot) if subscriber else rank_for_prompt(snapshot.items)
+            try:
+                message = await create_message(user_name, priority, snapshot, items=items)
+            except GenerationQueueFull:
+                self.retry_message_later(user_id)
+                return
+        logger.info(f"Sending message to {user_name} (ID: {user_id})")
+        await self._telegram("send_message", self.bot.send_message(chat_id=user_id, text=message))
+        # Only the stories the model chose to write about count as delivered
+        self.seen.mark(user_id, covered_items(message, items, config('storage.seen_items.min_title_overlap')))
+
+        if subscriber is not None:
+            subscriber.last_sent_at = time.time()
+            self.subscribers.save(subscriber)
+
+    def catch_up_missed_messages(self):
+        """Sends daily messages whose slot passed while the bot was down, within the grace period."""
+        grace = timedelta(seconds=config('scheduler.misfire_grace_seconds'))
+        now = datetime.now(timezone.utc)
+        for subscriber in self.subscribers:
+            due_at = subscriber.next_send_time(now) - timedelta(days=1)
+            missed = (
+                now - due_at <= grace
+                and subscriber.subscribed_at < due_at.timestamp()
+                and (subscriber.last_sent_at or 0) < due_at.timestamp()
+            )
+            if missed:
+                logger.info(f"Catching up missed message for {subscriber.name} (ID: {subscriber.user_id})")
+                self.scheduler.add_job(
+                    self.send_message,
+                    kwargs={"user_id": subscriber.user_id},
+                    id=f"catchup:{subscriber.user_id}",
+                    replace_existing=True
+                )
+
+    def retry_message_later(self, user_id: int):
+        """Re-queues a daily message that the generation queue turned away."""
+        delay = config('generation.retry_seconds')
+        logger.warning(f"Generation queue full, retrying message for {user_id} in {delay:.0f}s")
+        self.scheduler.add_job(
+            self.send_message,
+            DateTrigger(run_date=datetime.now(timezone.utc) + timedelta(seconds=delay)),
+            kwargs={"user_id": user_id},
+            id=f"retry:{user_id}",
+            replace_existing=True
+        )
+
+    @staticmethod
+    async def startup(application: Application):
+        """Starts background work on the bot's event loop."""
+        notifications = application.bot_data.get('notifications')
+        if notifications is not None:
+            notifications.scheduler.start()
+            notifications.catch_up_missed_messages()
+
+        if config('fetchers.background_refresh'):
+            from app.fetchers import FetcherRegistry
+            FetcherRegistry.start_background_refresh()
+
+        if config('metrics.enabled'):
+            server = metrics.MetricsServer(metrics.registry, config('metrics.host'), config('metrics.port'))
+            await server.start()
+            application.bot_data['metrics_server'] = server
+
+        from main import get_agent, warm_up
+        get_agent().start_health_checks(config('services.llm.health_check_seconds'))
+        if config('services.llm.warm_up'):
+            application.create_task(warm_up())
+
+    @staticmethod
+    async def shutdown(application: Application):
+        """Releases shared resources once the bot has stopped."""
+        from app.fetchers import FetcherRegistry
+        from app.fetchers.base import get_content_cache
+        from app.services.http import close_http_client
+        from main import get_agent
+        await get_agent().stop_health_checks()
+        server = application.bot_data.get('metrics_server')
+        if server is not None:
+            await server.stop()
+        await FetcherRegistry.stop_background_refresh()
+        await close_http_client()
+
+        cache = get_content_cache()
+        if cache is not None:
+            cache.close()
+
+        notifications = application.bot_data.get('notifications')
+        if notifications is not None:
+            if notifications.scheduler.running:
+                notifications.scheduler.shutdown(wait=False)
+            notifications.conversations.close()
+            notifications.seen.close()
+            notifications.subscribers.close()
 
     @staticmethod
     def run():
         """Starts the bot's application."""
-        app = Application.builder().token(config('services.telegram.token')).build()
+        app = (
+            Application.builder()
+            .token(config('services.telegram.token'))
+            .post_init(Notifications.startup)
+            .post_shutdown(Notifications.shutdown)
+            .build()
+        )
         notifications = Notifications()
+        app.bot_data['notifications'] = notifications
         app.add_handler(CommandHandler("start", notifications.start))
+        app.add_handler(CommandHandler("stop", notifications.stop))
+        app.add_handler(CommandHandler("stats", notifications.stats))
         app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, notifications.handle_message))
         app.run_polling()
@@ -0,0 +1,177 @@
+"""Per-subscriber index of stories already delivered, so digests don't repeat them."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import replace
+from typing import Dict, Iterable, List, Optional
+
+from app.fetchers.base import ContentItem
+from app.fetchers.dedup import normalise_title
+from app.services.sqlite import open_sqlite
+
+logger = logging.getLogger(__name__)
+
+# Words too common to show a message covered a story
+_STOP_WORDS = frozenset({"about", "after", "from", "have", "into", "over", "says", "than", "that", "this", "will", "with"})
+
+
+def item_key(item: ContentItem) -> int:
+    """64-bit key for a story, by normalised title so the same story from another source matches."""
+    title = normalise_title(item.title, strip_publisher=item.publisher_in_title)
+    digest = hashlib.blake2b(title.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)  # Fits an SQLite INTEGER
+
+
+def covered_items(text: str, items: Iterable[ContentItem], min_overlap: float = 0.5) -> List[ContentItem]:
+    """Items the message actually covers.
+
+    The model picks a few of the candidates and rewrites them, so an item counts
+    as covered when at least ``min_overlap`` of its title's significant words
+    appear in the message.
+    """
+    words = set(normalise_title(text).split())
+    covered = []
+    for item in items:
+        title = normalise_title(item.title, strip_publisher=item.publisher_in_title)
+        significant = {word for word in title.split() if len(word) > 3 and word not in _STOP_WORDS}
+        if significant and len(significant & words) >= min_overlap * len(significant):
+            covered.append(item)
+    return covered
+
+
+class SeenItems:
+    """Keys of delivered items per user, expiring after ``ttl_seconds``.
+
+    Each user's keys are loaded into a dict on first use and written through
+    to SQLite, so lookups while building a digest are hash hits. Time-sensitive
+    items (weather, breaking news) are never filtered.
+
+    One re-entrant lock guards the index and the connection, since ``expire``
+    runs as a scheduler job in a worker thread.
+    """
+
+    MODES = ("drop", "downweight")
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: float = 7 * 86400,
+        mode: str = "drop",
+        downweight: float = 0.3,
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown seen-items mode: {mode} (expected one of {self.MODES})")
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.mode = mode
+        self.downweight = downweight
+        self._seen: Dict[int, Dict[int, float]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def filter(self, user_id: int, items: Iterable[ContentItem]) -> List[ContentItem]:
+        """Drop, or lower the relevance of, items the user has already been sent."""
+        cutoff = time.time() - self.ttl_seconds
+        items = list(items)
+        with self._lock:
+            seen = self._keys(user_id)
+            sent = [seen.get(item_key(item)) for item in items]
+
+        results = []
+        repeats = 0
+        for item, sent_at in zip(items, sent):
+            if item.is_time_sensitive or sent_at is None or sent_at < cutoff:
+                results.append(item)
+                continue
+
+            repeats += 1
+            if self.mode == "downweight":
+                results.append(replace(item, relevance_score=item.relevance_score * self.downweight))
+
+        if repeats:
+            action = "Dropped" if self.mode == "drop" else "Down-weighted"
+            logger.info(f"{action} {repeats} already-sent items for {user_id}")
+        return results
+
+    def mark(self, user_id: int, items: Iterable[ContentItem], sent_at: Optional[float] = None) -> None:
+        """Record items as delivered to the user."""
+        sent_at = sent_at or time.time()
+        keys = [item_key(item) for item in items if not item.is_time_sensitive]
+        if not keys:
+            return
+
+        with self._lock:
+            seen = self._keys(user_id)
+            for key in keys:
+                seen[key] = sent_at
+            self._execute_many(
+                "INSERT OR REPLACE INTO seen_items (user_id, item_key, sent_at) VALUES (?, ?, ?)",
+                [(user_id, key, sent_at) for key in keys],
+            )
+
+    def forget(self, user_id: int) -> None:
+        """Drop everything recorded for a user."""
+        with self._lock:
+            self._seen.pop(user_id, None)
+            self._execute_many("DELETE FROM seen_items WHERE user_id = ?", [(user_id,)])
+
+    def expire(self) -> None:
+        """Remove entries older than the TTL from memory and disk."""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            for seen in self._seen.values():
+                expired = [key for key, sent_at in seen.items() if sent_at < cutoff]
+                for key in expired:
+                    del seen[key]
+            self._execute_many("DELETE FROM seen_items WHERE sent_at < ?", [(cutoff,)])
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _keys(self, user_id: int) -> Dict[int, float]:
+        """A user's index, loading it on first use; call with the lock held."""
+        seen = self._seen.get(user_id)
+        if seen is None:
+            seen = self._seen[user_id] = self._load(user_id)
+        return seen
+
+    def _load(self, user_id: int) -> Dict[int, float]:
+        if not self.path:
+            return {}
+        try:
+            with self._lock:
+                rows = self._connection().execute(
+                    "SELECT item_key, sent_at FROM seen_items WHERE user_id = ? AND sent_at >= ?",
+                    (user_id, time.time() - self.ttl_seconds),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to load seen items for {user_id}: {e}")
+            return {}
+        return dict(rows)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = open_sqlite(
+                self.path,
+                "CREATE TABLE IF NOT EXISTS seen_items ("
+                "user_id INTEGER NOT NULL, item_key INTEGER NOT NULL, sent_at REAL NOT NULL, "
+                "PRIMARY KEY (user_id, item_key)) WITHOUT ROWID",
+            )
+        return self._conn
+
+    def _execute_many(self, sql: str, params: List[tuple]) -> None:
+        if not self.path:
+            return
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.executemany(sql, params)
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to persist seen items: {e}")
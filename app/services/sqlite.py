@@ -0,0 +1,18 @@
+"""Shared setup for the SQLite files the bot persists its state in."""
+
+import os
+import sqlite3
+
+
+def open_sqlite(path: str, schema: str) -> sqlite3.Connection:
+    """Open (creating if needed) a WAL-mode database at ``path`` and apply ``schema``.
+
+    Connections are shared with the fetcher thread pool and with sync jobs
+    the scheduler runs in its executor, so callers guard them with their own lock.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(schema)
+    return conn
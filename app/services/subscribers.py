@@ -0,0 +1,155 @@
+"""Subscriber registry indexed by Telegram user id."""
+
+import hashlib
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, Optional
+
+from app.services.sqlite import open_sqlite
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Subscriber:
+    """A user receiving daily updates, with their own schedule and preferences."""
+    user_id: int
+    name: Optional[str] = None
+    hour: int = field(default_factory=lambda: random.randint(0, 23))  # UTC
+    minute: int = field(default_factory=lambda: random.randint(0, 59))
+    preferences: Dict[str, Any] = field(default_factory=dict)
+    subscribed_at: float = field(default_factory=time.time)
+    last_sent_at: Optional[float] = None
+
+    @property
+    def job_id(self) -> str:
+        """Scheduler job ID for this subscriber's daily message."""
+        return f"daily:{self.user_id}"
+
+    @property
+    def pregenerate_job_id(self) -> str:
+        """Scheduler job ID for preparing this subscriber's digest ahead of time."""
+        return f"pregenerate:{self.user_id}"
+
+    @property
+    def profile_key(self) -> str:
+        """Short stable key for everything that personalises a reply to this subscriber."""
+        profile = json.dumps([self.name, self.preferences], sort_keys=True)
+        return hashlib.sha1(profile.encode()).hexdigest()[:12]
+
+    def next_send_time(self, now: Optional[datetime] = None) -> datetime:
+        """The next UTC delivery time after ``now``."""
+        now = now or datetime.now(timezone.utc)
+        send_at = now.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        if send_at <= now:
+            send_at += timedelta(days=1)
+        return send_at
+
+
+class SubscriberRegistry:
+    """In-memory index of subscribers by user id, written through to SQLite.
+
+    All lookups are dict hits; the database is only read once at startup.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._subscribers: Dict[int, Subscriber] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+        if path:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def __iter__(self) -> Iterator[Subscriber]:
+        return iter(list(self._subscribers.values()))
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._subscribers
+
+    def get(self, user_id: int) -> Optional[Subscriber]:
+        return self._subscribers.get(user_id)
+
+    def save(self, subscriber: Subscriber) -> Subscriber:
+        """Add or update a subscriber."""
+        self._subscribers[subscriber.user_id] = subscriber
+        self._execute(
+            "INSERT OR REPLACE INTO subscribers "
+            "(user_id, name, hour, minute, preferences, subscribed_at, last_sent_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                subscriber.user_id,
+                subscriber.name,
+                subscriber.hour,
+                subscriber.minute,
+                json.dumps(subscriber.preferences),
+                subscriber.subscribed_at,
+                subscriber.last_sent_at,
+            ),
+        )
+        return subscriber
+
+    def remove(self, user_id: int) -> Optional[Subscriber]:
+        subscriber = self._subscribers.pop(user_id, None)
+        if subscriber is not None:
+            self._execute("DELETE FROM subscribers WHERE user_id = ?", (user_id,))
+        return subscriber
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = open_sqlite(
+                self.path,
+                "CREATE TABLE IF NOT EXISTS subscribers ("
+                "user_id INTEGER PRIMARY KEY, name TEXT, hour INTEGER NOT NULL, "
+                "minute INTEGER NOT NULL, preferences TEXT NOT NULL, subscribed_at REAL NOT NULL, "
+                "last_sent_at REAL)",
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(subscribers)")}
+            if "last_sent_at" not in columns:
+                self._conn.execute("ALTER TABLE subscribers ADD COLUMN last_sent_at REAL")
+        return self._conn
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        if not self.path:
+            return
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(sql, params)
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to persist subscriber change: {e}")
+
+    def _load(self) -> None:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT user_id, name, hour, minute, preferences, subscribed_at, last_sent_at "
+                "FROM subscribers"
+            ).fetchall()
+
+        for user_id, name, hour, minute, preferences, subscribed_at, last_sent_at in rows:
+            self._subscribers[user_id] = Subscriber(
+                user_id=user_id,
+                name=name,
+                hour=hour,
+                minute=minute,
+                preferences=json.loads(preferences),
+                subscribed_at=subscribed_at,
+                last_sent_at=last_sent_at,
+            )
+        logger.info(f"Loaded {len(self._subscribers)} subscribers")
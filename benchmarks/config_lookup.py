@@ -0,0 +1,32 @@
+"""Microbenchmark for config() lookups.
+
+Run from the repository root:
+
+    python -m benchmarks.config_lookup
+"""
+
+import timeit
+
+from config import Config, config
+
+KEYS = [
+    "services.openweathermap.api_key",  # WeatherFetcher.is_available / _fetch
+    "app.user.name",  # Twice per create_message prompt
+    "services.ollama.model",
+    "services.missing.key",  # Default path
+]
+
+
+def main(number: int = 200_000) -> None:
+    Config()  # Load once up front so the first lookup isn't counted
+
+    for key in KEYS:
+        seconds = timeit.timeit(lambda: config(key), number=number)
+        print(f"{key:40s} {seconds / number * 1e9:8.1f} ns/lookup")
+
+    seconds = timeit.timeit(Config.reload, number=100)
+    print(f"{'Config.reload()':40s} {seconds / 100 * 1e6:8.1f} us/reload")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Memory and serialization benchmark for ContentItem.
+
+Compares the slotted, interned ContentItem with the previous plain dataclass
+layout, and the binary cache format with the previous JSON one.
+
+Run from the repository root:
+
+    python -m benchmarks.content_item
+"""
+
+import json
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from app.fetchers.base import ContentCategory, ContentItem, pack_items, unpack_items
+
+SOURCES = ["Chronicle Live", "Google News", "NHS Newcastle", "Hacker News", "Newcastle University"]
+
+
+@dataclass
+class PlainContentItem:
+    """The layout ContentItem had before: a regular dataclass with a __dict__."""
+    title: str
+    category: ContentCategory
+    source: str
+    summary: Optional[str] = None
+    relevance_score: float = 1.0
+    is_time_sensitive: bool = False
+
+
+def _fields(i: int) -> dict:
+    # Sources are built at runtime, as feed parsing does, so equal names aren't shared for free
+    return {
+        "title": f"Story number {i} about something happening in Newcastle today",
+        "category": ContentCategory.LOCAL_NEWS,
+        "source": "".join(SOURCES[i % len(SOURCES)]),
+        "summary": f"A short summary of story {i}, " + "with a little more detail. " * 4,
+        "relevance_score": 0.9,
+    }
+
+
+def _measure(build, count: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    items = [build(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del items
+    return size / count
+
+
+def main(count: int = 10_000, number: int = 20) -> None:
+    plain = _measure(lambda i: PlainContentItem(**_fields(i)), count)
+    slotted = _measure(lambda i: ContentItem(**_fields(i)), count)
+    print(f"{'plain dataclass':24s} {plain:8.1f} bytes/item")
+    print(f"{'slotted + interned':24s} {slotted:8.1f} bytes/item ({1 - slotted / plain:.0%} smaller)")
+
+    items = [ContentItem(**_fields(i)) for i in range(100)]
+    as_json = json.dumps([{**asdict(item), "category": item.category.value} for item in items]).encode()
+    as_binary = pack_items(items)
+    print(f"{'JSON, 100 items':24s} {len(as_json):8d} bytes")
+    print(f"{'binary, 100 items':24s} {len(as_binary):8d} bytes")
+
+    seconds = timeit.timeit(lambda: pack_items(items), number=number)
+    print(f"{'pack_items(100)':24s} {seconds / number * 1e6:8.1f} us")
+    seconds = timeit.timeit(lambda: unpack_items(as_binary), number=number)
+    print(f"{'unpack_items(100)':24s} {seconds / number * 1e6:8.1f} us")
+    seconds = timeit.timeit(lambda: [ContentItem(**{**d, "category": ContentCategory(d["category"])})
+                                     for d in json.loads(as_json)], number=number)
+    print(f"{'JSON load(100)':24s} {seconds / number * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,52 +1,77 @@
+import importlib
 import os
-from typing import Self
+from types import MappingProxyType
+from typing import Any, Mapping, Self
 
 class Config:
     _instance = None
 
     def __new__(cls):
-        cls._instance = super(Config, cls).__new__(cls)
-        cls.config_dict = {}
-        cls.load_config()
+        if cls._instance is None:
+            instance = super(Config, cls).__new__(cls)
+            instance.load_config()
+            cls._instance = instance
 
         return cls._instance
 
-    @staticmethod
-    def load_config():
+    def load_config(self, reload_modules=False):
         """
-        Auto-discover config files
+        Auto-discover config files and index every value by its dotted path
         """
         config_dir = os.path.dirname(__file__)
+        config_dict = {}
 
-        for filename in os.listdir(config_dir):
+        for filename in sorted(os.listdir(config_dir)):
             if filename.endswith('.py') and filename != '__init__.py':
                 module_name = filename[:-3]
-                module = __import__(f'config.{module_name}', fromlist=['config'])
-                Config._instance.config_dict[module_name] = module.config
+                module = importlib.import_module(f'config.{module_name}')
+                if reload_modules:
+                    module = importlib.reload(module)
+                config_dict[module_name] = module.config
 
-    @staticmethod
-    def get(path, default=None):
-        config_instance = Config()
+        self.config_dict = self._freeze(config_dict)
+        self.index = MappingProxyType(self._flatten(self.config_dict))
 
-        keys = path.split('.')
+    @staticmethod
+    def _freeze(value: Any) -> Any:
+        """Recursively wrap dicts in read-only views and turn lists into tuples"""
+        if isinstance(value, Mapping):
+            return MappingProxyType({key: Config._freeze(item) for key, item in value.items()})
+        if isinstance(value, list):
+            return tuple(Config._freeze(item) for item in value)
+        return value
 
-        # Start with the base configuration dictionary
-        current_level = config_instance.config_dict
+    @staticmethod
+    def _flatten(tree: Mapping, prefix: str = '') -> dict:
+        """
+        Map every dotted path to its value, including intermediate sections,
+        e.g. 'services', 'services.ollama' and 'services.ollama.host'
+        """
+        index = {}
+        for key, value in tree.items():
+            path = f'{prefix}{key}'
+            index[path] = value
+            if isinstance(value, Mapping):
+                index.update(Config._flatten(value, f'{path}.'))
 
-        # Traverse the dictionary to get the value
-        for key in keys[:-1]:
-            if key not in current_level or not isinstance(current_level[key], dict):
-                return default
+        return index
 
-            current_level = current_level[key]
+    @staticmethod
+    def get(path, default=None):
+        instance = Config._instance or Config()
 
-        final_key = keys[-1]
+        return instance.index.get(path, default)
 
-        return current_level.get(final_key, default)
+    @classmethod
+    def reload(cls) -> Self:
+        """
+        Re-import every config module (picking up environment changes) and rebuild the index
+        """
+        instance = super(Config, cls).__new__(cls)
+        instance.load_config(reload_modules=True)
+        cls._instance = instance
 
-    def reload(self):
-        self._instance = None
-        Config()
+        return instance
 
 def config(path, default=None):
     """
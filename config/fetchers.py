@@ -0,0 +1,29 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+config = {
+    "background_refresh": os.getenv("FETCHERS_BACKGROUND_REFRESH", "true").lower() == "true",
+    # Refresh this many seconds before a fetcher's cache TTL runs out (capped at 10% of the TTL)
+    "refresh_lead_seconds": float(os.getenv("FETCHERS_REFRESH_LEAD_SECONDS", 120)),
+    # Back-off before retrying a refresh that failed
+    "refresh_retry_seconds": float(os.getenv("FETCHERS_REFRESH_RETRY_SECONDS", 300)),
+    # How long one content snapshot (items + formatted prompt) is shared between sends
+    "snapshot_seconds": float(os.getenv("FETCHERS_SNAPSHOT_SECONDS", 600)),
+    "ranking": {
+        # Only this many top-ranked items are passed to the LLM; 0 passes everything
+        "top_k": int(os.getenv("FETCHERS_TOP_K", 12)),
+        # Per-category caps overriding the defaults, e.g. "local_news:4,tech:2"
+        "quotas": {
+            category.strip(): int(limit)
+            for category, limit in (
+                pair.split(":") for pair in os.getenv("FETCHERS_CATEGORY_QUOTAS", "").split(",") if ":" in pair
+            )
+        },
+        # Hours for a story's freshness boost to halve
+        "half_life_hours": float(os.getenv("FETCHERS_RECENCY_HALF_LIFE_HOURS", 24)),
+    },
+    # Share of title words (0-1) at which stories from different sources are merged; 1 needs the same words
+    "dedup_threshold": float(os.getenv("FETCHERS_DEDUP_THRESHOLD", 0.8)),
+}
@@ -0,0 +1,30 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+config = {
+    # Concurrent generations; match the LLM server's parallel slots (OLLAMA_NUM_PARALLEL)
+    "concurrency": int(os.getenv("GENERATION_CONCURRENCY", 1)),
+    # Requests allowed to wait for a slot before new ones are turned away
+    "max_waiting": int(os.getenv("GENERATION_MAX_WAITING", 100)),
+    # Delay before retrying a scheduled message that was turned away
+    "retry_seconds": float(os.getenv("GENERATION_RETRY_SECONDS", 300)),
+    "response_cache": {
+        # Reuse replies to equivalent data questions ("any news?") while the content is unchanged
+        "enabled": os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true",
+        # Upper bound on reuse, even if the fetchers' results stay fresh for longer
+        "max_seconds": float(os.getenv("RESPONSE_CACHE_MAX_SECONDS", 1800)),
+        "maxsize": int(os.getenv("RESPONSE_CACHE_MAXSIZE", 256)),
+    },
+    "pregenerate": {
+        # Prepare each daily digest ahead of its send time so delivery is just a Telegram send
+        "enabled": os.getenv("PREGENERATE_ENABLED", "true").lower() == "true",
+        # Start trying this many minutes before the send time, when the queue is idle
+        "lead_minutes": int(os.getenv("PREGENERATE_LEAD_MINUTES", 30)),
+        # Seconds between checks for an idle queue
+        "poll_seconds": float(os.getenv("PREGENERATE_POLL_SECONDS", 30)),
+        # Regenerate at send time if content similarity to the prepared digest drops below this
+        "min_similarity": float(os.getenv("PREGENERATE_MIN_SIMILARITY", 0.6)),
+    },
+}
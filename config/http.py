@@ -0,0 +1,15 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+config = {
+    "timeout": float(os.getenv("HTTP_TIMEOUT", 10.0)),
+    "connect_timeout": float(os.getenv("HTTP_CONNECT_TIMEOUT", 5.0)),
+    "http2": os.getenv("HTTP_HTTP2", "true").lower() == "true",
+    "max_connections": int(os.getenv("HTTP_MAX_CONNECTIONS", 20)),
+    "max_keepalive_connections": int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", 10)),
+    "max_connections_per_host": int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", 4)),
+    "keepalive_expiry": float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 120.0)),
+    "user_agent": "GoodScoop/1.0 (https://github.com/thatgardnerone/goodscoop)",
+}
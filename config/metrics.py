@@ -0,0 +1,11 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+config = {
+    # Serve Prometheus text-format metrics over HTTP (bind to localhost unless scraped remotely)
+    "enabled": os.getenv("METRICS_ENABLED", "false").lower() == "true",
+    "host": os.getenv("METRICS_HOST", "127.0.0.1"),
+    "port": int(os.getenv("METRICS_PORT", 9464)),
+}
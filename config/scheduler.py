@@ -0,0 +1,9 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+config = {
+    # Late firings (e.g. after a restart) within this window still run, once
+    "misfire_grace_seconds": int(os.getenv("SCHEDULER_MISFIRE_GRACE_SECONDS", 3600)),
+}
@@ -4,13 +4,44 @@ from dotenv import load_dotenv
 load_dotenv()
 
 config = {
+    "llm": {
+        # Backends to route between, in order of preference, e.g. "ollama" or "openai,ollama"
+        "backends": [b.strip() for b in os.getenv("LLM_SERVICE", "ollama").split(",") if b.strip()],
+        # Prompt + reply must fit the model's context; history and content are trimmed to the rest
+        "context_tokens": int(os.getenv("LLM_CONTEXT_TOKENS", 4096)),
+        "response_tokens": int(os.getenv("LLM_RESPONSE_TOKENS", 1024)),
+        # Load the model and prime the prompt cache when the bot starts
+        "warm_up": os.getenv("LLM_WARM_UP", "true").lower() == "true",
+        # Seconds between background checks that each backend is up
+        "health_check_seconds": int(os.getenv("LLM_HEALTH_CHECK_SECONDS", 60)),
+    },
     "ollama": {
         "host": os.getenv("LLM_HOST", "http://localhost:11434"),
         "model": os.getenv("LLM_MODEL", "deepseek-r1:8b"),
-        "temperature": os.getenv("LLM_TEMPERATURE", 0.7),
+        "temperature": float(os.getenv("LLM_TEMPERATURE", 0.7)),
+        # Max tokens a reasoning model may spend in <think> before being asked to answer directly
+        "reasoning_budget": int(os.getenv("LLM_REASONING_BUDGET")) if os.getenv("LLM_REASONING_BUDGET") else None,
+        # How long Ollama keeps the model (and its prompt cache) loaded after a request, e.g. "30m" or "-1"
+        "keep_alive": os.getenv("LLM_KEEP_ALIVE", "30m"),
+    },
+    "openai": {
+        # Any OpenAI-compatible server, e.g. llama.cpp or vLLM; comma-separate several base URLs
+        "base_urls": [u.strip() for u in os.getenv("LLM_OPENAI_BASE_URL", "http://localhost:8080/v1").split(",") if u.strip()],
+        "model": os.getenv("LLM_OPENAI_MODEL", os.getenv("LLM_MODEL", "deepseek-r1:8b")),
+        "api_key": os.getenv("LLM_API_KEY"),
+        "temperature": float(os.getenv("LLM_TEMPERATURE", 0.7)),
     },
     "telegram": {
         "token": os.getenv("TELEGRAM_TOKEN"),
+        # User IDs allowed to run admin commands such as /stats
+        "admin_ids": [
+            int(user_id) for user_id in
+            os.getenv("TELEGRAM_ADMIN_IDS", os.getenv("TELEGRAM_CHAT_ID", "")).split(",") if user_id.strip()
+        ],
+        # Stream chat replies by editing the message as tokens arrive
+        "stream_replies": os.getenv("TELEGRAM_STREAM_REPLIES", "true").lower() == "true",
+        # Minimum seconds between edits (Telegram rate-limits message edits)
+        "edit_interval": float(os.getenv("TELEGRAM_EDIT_INTERVAL", 1.0)),
     },
     "openweathermap": {
         "api_key": os.getenv("OPENWEATHERMAP_API_KEY"),
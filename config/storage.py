@@ -0,0 +1,35 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+data_dir = os.getenv("DATA_DIR", os.path.join(os.path.expanduser("~"), ".goodscoop"))
+
+config = {
+    "data_dir": data_dir,
+    "content_cache": {
+        "enabled": os.getenv("CONTENT_CACHE_ENABLED", "true").lower() == "true",
+        "path": os.getenv("CONTENT_CACHE_PATH", os.path.join(data_dir, "content_cache.sqlite3")),
+    },
+    "subscribers": {
+        "path": os.getenv("SUBSCRIBERS_PATH", os.path.join(data_dir, "subscribers.sqlite3")),
+    },
+    "seen_items": {
+        # Empty path keeps the index in memory only
+        "path": os.getenv("SEEN_ITEMS_PATH", os.path.join(data_dir, "seen_items.sqlite3")),
+        # How long a delivered story is kept out of a subscriber's digests
+        "ttl_days": float(os.getenv("SEEN_ITEMS_TTL_DAYS", 7)),
+        # "drop" repeats, or "downweight" their relevance so they only return on a quiet day
+        "mode": os.getenv("SEEN_ITEMS_MODE", "drop"),
+        "downweight": float(os.getenv("SEEN_ITEMS_DOWNWEIGHT", 0.3)),
+        # Share of a story's title words a message must contain for the story to count as delivered
+        "min_title_overlap": float(os.getenv("SEEN_ITEMS_MIN_TITLE_OVERLAP", 0.5)),
+    },
+    "conversations": {
+        # Empty path keeps history in memory only
+        "path": os.getenv("CONVERSATIONS_PATH", os.path.join(data_dir, "conversations.sqlite3")),
+        "max_messages": int(os.getenv("CONVERSATIONS_MAX_MESSAGES", 20)),
+        "max_users": int(os.getenv("CONVERSATIONS_MAX_USERS", 1000)),
+        "flush_seconds": int(os.getenv("CONVERSATIONS_FLUSH_SECONDS", 30)),
+    },
+}
@@ -2,11 +2,18 @@
 
 import logging
 import sys
+import time
 from datetime import datetime
 from textwrap import dedent
+from typing import AsyncIterator, Optional, Sequence
 
 from app.fetchers import FetcherRegistry, format_content_for_prompt
-from app.services.agents.ollama_agent import OllamaAgent as Agent
+from app.fetchers.base import ContentItem, TTLCache
+from app.fetchers.ranking import rank_for_prompt
+from app.fetchers.snapshot import ContentSnapshot
+from app.services import metrics
+from app.services.generation_queue import Priority, get_generation_queue
+from app.services.agents import Agent, create_agent
 from config import config
 
 # Configure logging to stdout for systemd
@@ -18,12 +25,60 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-agent = Agent()
-
-
-async def create_message():
-    """Generates the daily message content."""
-    now = datetime.now()
+_agent: Optional[Agent] = None
+
+
+def get_agent() -> Agent:
+    """Return the shared agent, creating it on first use (no network I/O)."""
+    global _agent
+    if _agent is None:
+        _agent = create_agent()
+    return _agent
+
+
+DAILY_INSTRUCTIONS = dedent(
+    """
+    INSTRUCTIONS:
+    - Your name is GoodScoop, and you create a personalised daily update for your friend, the RECIPIENT named below.
+    - Your tone should be warm, conversational, and slightly playful.
+    - You have content from multiple sources: weather, local Newcastle news, Newcastle University, Freeman Hospital/NHS, tech/AI news, calendar events, historical facts, and world news.
+
+    CONTENT BALANCING (decide what to include based on relevance and interest):
+    - Weather: Always mention briefly (it's practical for planning the day)
+    - Local Newcastle news (Chronicle Live): Priority over national news - Jamie lives here
+    - Newcastle University news: Relevant to Jamie's PhD studies
+    - Freeman Hospital/NHS news: Relevant to Jamie's wife who works as a paeds ICU nurse there
+    - Tech/AI news: Jamie is interested in technology
+    - Calendar events: Mention bank holidays or seasonal events prominently if relevant
+    - "On this day" historical facts: Use sparingly for variety - only if genuinely interesting
+    - World news: Include major stories but don't overwhelm with too many
+    - Pick 4-6 most relevant/interesting items total. Skip content that seems less relevant today.
+
+    OUTPUT REQUIREMENTS:
+    - Start with a greeting that reflects the CURRENT TIME, day, or notable events.
+      Be subtle and natural—like a radio presenter giving a quick update.
+    - Plain text only (SMS format). No Markdown. Use whitespace, punctuation, and occasional emojis for personality.
+    - Keep it concise but informative.
+
+    DO NOT respond to this prompt; write your reply directed to the RECIPIENT.
+    """
+).strip()
+
+
+async def create_message(
+    user_name: Optional[str] = None,
+    priority: Priority = Priority.SCHEDULED,
+    snapshot: Optional[ContentSnapshot] = None,
+    send_at: Optional[datetime] = None,
+    items: Optional[Sequence[ContentItem]] = None,
+):
+    """Generates the daily message content for a subscriber (defaults to the configured user).
+
+    ``send_at`` is when the message will be delivered, for messages generated ahead of time.
+    ``items`` are the candidates to write about; by default the snapshot's top-ranked items.
+    """
+    user_name = user_name or config('app.user.name')
+    now = send_at.astimezone() if send_at else datetime.now()
     current_datetime = {
         "day": now.strftime('%A'),
         "date": now.strftime('%d'),
@@ -33,84 +88,153 @@ async def create_message():
     }
     logger.info(f"Generating message for {current_datetime['day']} {current_datetime['time']}")
 
-    # Fetch content from all sources
-    all_content = await FetcherRegistry.fetch_all()
-    formatted_content = format_content_for_prompt(all_content)
-
-    instructions = dedent(
-        f"""
-        INSTRUCTIONS:
-        - Your name is GoodScoop, and you create a personalised daily update for your friend {config('app.user.name')}.
-        - Your tone should be warm, conversational, and slightly playful.
-        - You have content from multiple sources: weather, local Newcastle news, Newcastle University, Freeman Hospital/NHS, tech/AI news, calendar events, historical facts, and world news.
-
-        CONTENT BALANCING (decide what to include based on relevance and interest):
-        - Weather: Always mention briefly (it's practical for planning the day)
-        - Local Newcastle news (Chronicle Live): Priority over national news - Jamie lives here
-        - Newcastle University news: Relevant to Jamie's PhD studies
-        - Freeman Hospital/NHS news: Relevant to Jamie's wife who works as a paeds ICU nurse there
-        - Tech/AI news: Jamie is interested in technology
-        - Calendar events: Mention bank holidays or seasonal events prominently if relevant
-        - "On this day" historical facts: Use sparingly for variety - only if genuinely interesting
-        - World news: Include major stories but don't overwhelm with too many
-        - Pick 4-6 most relevant/interesting items total. Skip content that seems less relevant today.
-
-        OUTPUT REQUIREMENTS:
-        - Start with a greeting that reflects the current time, day, or notable events based on: {current_datetime}
-          Be subtle and natural—like a radio presenter giving a quick update.
-        - Plain text only (SMS format). No Markdown. Use whitespace, punctuation, and occasional emojis for personality.
-        - Keep it concise but informative.
-
-        DO NOT respond to this prompt; write your reply directed to {config('app.user.name')}.
-
-        AVAILABLE CONTENT:
-        {formatted_content}
-        """
-    ).strip()
-
-    summarised_news = await agent.chat(instructions)
-    # Strip DeepSeek R1 thinking tags if present
-    if "</think>" in summarised_news:
-        summarised_news = summarised_news.split("</think>")[1]
-    summarised_news = summarised_news.strip()
+    # Content and its formatting are shared by every message in the snapshot window
+    snapshot = snapshot or await FetcherRegistry.snapshot()
+    if items is None:
+        items = rank_for_prompt(snapshot.items)
+    formatted_content = format_content_for_prompt(list(items))
+
+    # Stable instructions first so Ollama can reuse the processed prefix across calls;
+    # content (shared within a snapshot window), then the per-message details go last
+    instructions = "\n\n".join([
+        DAILY_INSTRUCTIONS,
+        f"AVAILABLE CONTENT:\n{formatted_content}",
+        f"RECIPIENT: {user_name}\nCURRENT TIME: {current_datetime}",
+    ])
+
+    # Reasoning is filtered out by the agent as the reply streams in
+    async with get_generation_queue().slot(priority):
+        summarised_news = await get_agent().chat(instructions)
     logger.debug(f"Generated message: {summarised_news[:100]}...")
 
     return summarised_news
 
 
-async def chat_response(user_message: str, history: list[dict]) -> str:
-    """Generate a chat response to user message."""
-    msg_lower = user_message.lower()
+async def warm_up():
+    """Loads the model with the daily instructions cached, logging rather than raising on failure."""
+    try:
+        await get_agent().warm_up(DAILY_INSTRUCTIONS)
+    except Exception as e:
+        logger.warning(f"Model warm-up failed: {e}")
 
-    # Detect if this is a follow-up question (references previous context)
-    followup_patterns = ["tell me more", "more about", "what about", "elaborate", "explain",
-                         "that", "this", "the one", "which one", "go on"]
-    is_followup = any(p in msg_lower for p in followup_patterns)
 
-    # Only fetch fresh data for direct questions, not follow-ups
-    # Follow-ups should use conversation history instead
-    data_keywords = ["what's the news", "what's the weather", "what's happening",
-                     "give me an update", "any news", "weather forecast", "headlines"]
-    needs_fresh_data = any(kw in msg_lower for kw in data_keywords) and not is_followup
+# Phrases that refer back to earlier messages; these are answered from the conversation history
+FOLLOWUP_PATTERNS = ["tell me more", "more about", "what about", "elaborate", "explain",
+                     "that", "this", "the one", "which one", "go on"]
+
+# Direct data questions, by the intent their replies can be shared under
+DATA_INTENTS = {
+    "news": ["what's the news", "what's happening", "give me an update", "any news", "headlines"],
+    "weather": ["what's the weather", "weather forecast"],
+}
+
+_response_cache: TTLCache[tuple, str] = TTLCache(
+    ttl_seconds=config('generation.response_cache.max_seconds'),
+    maxsize=config('generation.response_cache.maxsize'),
+)
+metrics.registry.register_cache("responses", _response_cache.stats)
+
+
+def _normalise(user_message: str) -> str:
+    return " ".join(user_message.lower().replace("’", "'").split())
 
-    context = ""
-    if needs_fresh_data:
-        all_content = await FetcherRegistry.fetch_all()
-        context = f"\n\nCurrent data available:\n{format_content_for_prompt(all_content)}"
 
-    if is_followup:
+def _is_followup(user_message: str) -> bool:
+    msg_lower = _normalise(user_message)
+    return any(p in msg_lower for p in FOLLOWUP_PATTERNS)
+
+
+def _data_intent(user_message: str) -> Optional[str]:
+    """The data intent a message asks for directly, or None for follow-ups and other chat."""
+    if _is_followup(user_message):
+        return None
+
+    msg_lower = _normalise(user_message)
+    for intent, keywords in DATA_INTENTS.items():
+        if any(kw in msg_lower for kw in keywords):
+            return intent
+    return None
+
+
+async def _chat_prompt(user_message: str) -> tuple[str, Optional[ContentSnapshot]]:
+    """Build the prompt for a chat message, with the content snapshot if it asks for current data."""
+    # Only fetch fresh data for direct questions, not follow-ups
+    snapshot = None
+    if _data_intent(user_message):
+        snapshot = await FetcherRegistry.snapshot()
+
+    if _is_followup(user_message):
         prompt = f"""{user_message}
 
 The user is asking a follow-up question about something from your previous messages.
 Look at the conversation history and respond specifically to their question.
 Don't give a full news update - just answer what they asked about."""
     else:
-        prompt = f"""{user_message}{context}
+        prompt = f"""{user_message}
 
 Respond as GoodScoop - friendly, warm, and playful like chatting with a friend.
 Keep responses concise and conversational."""
 
-    return await agent.chat_with_history(prompt, history)
+    return prompt, snapshot
+
+
+def _response_key(user_message: str, snapshot: Optional[ContentSnapshot], profile: Optional[str]) -> Optional[tuple]:
+    """Cache key for a reply that only depends on the question's intent, the content and the user."""
+    intent = _data_intent(user_message)
+    if not config('generation.response_cache.enabled') or intent is None or snapshot is None:
+        return None
+    return intent, snapshot.version, profile
+
+
+def _cache_response(key: Optional[tuple], snapshot: ContentSnapshot, response: str) -> None:
+    """Keep a reply until the content it was based on may change."""
+    if key is None or not response:
+        return
+    now = time.time()
+    expires_at = FetcherRegistry.content_expires_at() or snapshot.expires_at
+    ttl = min(expires_at - now, config('generation.response_cache.max_seconds'))
+    if ttl > 0:
+        _response_cache.set(key, response, ttl_seconds=ttl)
+
+
+async def chat_response(user_message: str, history: list[dict], profile: Optional[str] = None) -> str:
+    """Generate a chat response to user message.
+
+    ``profile`` identifies the user's personalisation, so cached replies are never shared across profiles.
+    """
+    prompt, snapshot = await _chat_prompt(user_message)
+    key = _response_key(user_message, snapshot, profile)
+    cached = _response_cache.get(key) if key else None
+    if cached is not None:
+        logger.info(f"Serving cached reply for {key[0]} (content {key[1]})")
+        return cached
+
+    content = snapshot.formatted if snapshot else None
+    async with get_generation_queue().slot(Priority.INTERACTIVE):
+        response = await get_agent().chat_with_history(prompt, history, content)
+    _cache_response(key, snapshot, response)
+    return response
+
+
+async def chat_response_stream(
+    user_message: str, history: list[dict], profile: Optional[str] = None
+) -> AsyncIterator[str]:
+    """Stream a chat response to user message as it is generated."""
+    prompt, snapshot = await _chat_prompt(user_message)
+    key = _response_key(user_message, snapshot, profile)
+    cached = _response_cache.get(key) if key else None
+    if cached is not None:
+        logger.info(f"Serving cached reply for {key[0]} (content {key[1]})")
+        yield cached
+        return
+
+    content = snapshot.formatted if snapshot else None
+    chunks = []
+    async with get_generation_queue().slot(Priority.INTERACTIVE):
+        async for chunk in get_agent().chat_stream(prompt, history, content):
+            chunks.append(chunk)
+            yield chunk
+    _cache_response(key, snapshot, "".join(chunks).strip())
 
 
 def run():
@@ -0,0 +1,11 @@
+import pytest
+
+from app.fetchers.base import ContentCategory, ContentItem
+
+
+@pytest.fixture
+def item():
+    """Factory for content items, defaulting to a local news story from Chronicle Live."""
+    def make(title, source="Chronicle Live", category=ContentCategory.LOCAL_NEWS, **kwargs):
+        return ContentItem(title=title, category=category, source=source, **kwargs)
+    return make
@@ -0,0 +1,42 @@
+import pytest
+
+from app.fetchers.base import ContentCategory, ContentItem, pack_items, unpack_items
+
+
+def test_pack_round_trips_every_field():
+    items = [
+        ContentItem(title="Sunny, 18°C", category=ContentCategory.WEATHER, source="OpenWeatherMap",
+                    is_time_sensitive=True),
+        ContentItem(
+            title="Metro fares rise - BBC News",
+            category=ContentCategory.LOCAL_NEWS,
+            source="Google News",
+            summary="Fares go up in April. Émoji too: 🚇",
+            relevance_score=0.7,
+            merged_sources=("Chronicle Live", "NHS Newcastle"),
+            published_at=1_700_000_000.5,
+            publisher_in_title=True,
+        ),
+        ContentItem(title="", category=ContentCategory.HISTORY, source="Wikipedia", summary=""),
+    ]
+    assert unpack_items(pack_items(items)) == items
+
+
+def test_pack_round_trips_an_empty_list():
+    assert unpack_items(pack_items([])) == []
+
+
+def test_single_item_round_trips():
+    item = ContentItem(title="New bridge", category=ContentCategory.LOCAL_NEWS, source="Chronicle Live")
+    assert ContentItem.from_bytes(item.to_bytes()) == item
+
+
+def test_unpacked_sources_are_interned():
+    items = [ContentItem(title=str(i), category=ContentCategory.TECH, source="Hacker News") for i in range(2)]
+    first, second = unpack_items(pack_items(items))
+    assert first.source is second.source
+
+
+def test_unpack_rejects_other_data():
+    with pytest.raises(ValueError):
+        unpack_items(b'[{"title": "json"}]')
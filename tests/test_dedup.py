@@ -0,0 +1,85 @@
+from app.fetchers.dedup import deduplicate, normalise_title
+from app.services.seen import item_key
+
+
+def test_normalise_title_strips_punctuation_and_case():
+    assert normalise_title("  Metro FARES rise: what's changing? ") == "metro fares rise what s changing"
+
+
+def test_normalise_title_only_strips_publisher_when_asked():
+    title = "Metro fares rise - BBC News"
+    assert normalise_title(title) == "metro fares rise bbc news"
+    assert normalise_title(title, strip_publisher=True) == "metro fares rise"
+
+
+def test_keeps_distinct_stories(item):
+    items = [item("Metro fares rise in April"), item("New bridge opens over the Tyne")]
+    assert deduplicate(items) == items
+
+
+def test_merges_exact_title_match_keeping_most_relevant(item):
+    items = [
+        item("Metro fares rise in April", relevance_score=0.6),
+        item("Metro fares rise in April!", source="Google News", relevance_score=0.9),
+    ]
+    [merged] = deduplicate(items)
+    assert merged.source == "Google News"
+    assert merged.merged_sources == ("Chronicle Live",)
+
+
+def test_merges_near_duplicates(item):
+    items = [
+        item("Newcastle Metro fares to rise by 5% from April"),
+        item("Newcastle Metro fares to rise by 5 per cent from April", source="Google News"),
+    ]
+    assert len(deduplicate(items)) == 1
+
+
+def test_threshold_of_one_only_merges_exact_titles(item):
+    items = [
+        item("Newcastle Metro fares to rise by 5% from April"),
+        item("Newcastle Metro fares to rise by 5 per cent from April", source="Google News"),
+    ]
+    assert len(deduplicate(items, threshold=1.0)) == 2
+
+
+def test_publisher_suffix_is_stripped_for_google_news_backed_fetchers(item):
+    local = item("RVI nurses win award")
+    hospital = item(
+        "RVI nurses win award - Newcastle Hospitals NHS Foundation Trust",
+        source="NHS Newcastle",
+        publisher_in_title=True,
+    )
+    [merged] = deduplicate([local, hospital])
+    assert merged.merged_sources == ("NHS Newcastle",)
+    assert item_key(local) == item_key(hospital)
+
+
+def test_merged_item_is_time_sensitive_if_any_duplicate_was(item):
+    items = [
+        item("Storm warning for the North East", relevance_score=0.9),
+        item("Storm warning for the North East", source="Google News", relevance_score=0.5, is_time_sensitive=True),
+    ]
+    [merged] = deduplicate(items)
+    assert merged.is_time_sensitive
+    assert merged.source == "Chronicle Live"
+
+
+def test_similar_stories_from_one_source_are_kept(item):
+    items = [
+        item("Man arrested after stabbing in Gateshead"),
+        item("Woman arrested after stabbing in Gateshead"),
+    ]
+    assert deduplicate(items) == items
+
+
+def test_similar_headlines_about_different_events_are_kept(item):
+    items = [
+        item("Newcastle United beat Chelsea 2-1 at St James Park"),
+        item("Newcastle United lose to Chelsea 2-1 at St James Park", source="Google News"),
+    ]
+    assert len(deduplicate(items)) == 2
+
+
+def test_identical_titles_from_one_source_collapse(item):
+    assert len(deduplicate([item("Tyne Bridge reopens"), item("Tyne Bridge reopens")])) == 1
@@ -0,0 +1,78 @@
+import asyncio
+import time
+
+import pytest
+
+from app.fetchers import base
+from app.fetchers.base import BaseFetcher, ContentCategory
+
+
+class StubFetcher(BaseFetcher):
+    name = "stub"
+    category = ContentCategory.CALENDAR
+    cache_jitter = 0.0
+
+    def __init__(self, results):
+        super().__init__()
+        self.results = list(results)
+        self._restored = True
+
+    async def _fetch(self):
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture(autouse=True)
+def no_content_cache(monkeypatch):
+    monkeypatch.setattr(base, "get_content_cache", lambda: None)
+
+
+def expire(fetcher, seconds_ago=1.0):
+    entry = fetcher._cache.peek(fetcher._CACHE_KEY)
+    fetcher._cache.set(fetcher._CACHE_KEY, entry.value, ttl_seconds=0, inserted_at=time.time() - seconds_ago)
+
+
+def test_empty_result_replaces_the_last_one(item):
+    fetcher = StubFetcher([[item("Today is Early May bank holiday!")], []])
+    fetcher.stale_grace_seconds = 3600
+
+    async def scenario():
+        first = await fetcher.fetch()
+        expire(fetcher)
+        assert await fetcher.refresh()
+        return first, await fetcher.fetch()
+
+    first, second = asyncio.run(scenario())
+    assert [i.title for i in first] == ["Today is Early May bank holiday!"]
+    assert second == []
+
+
+def test_failure_serves_last_result_only_within_grace(item):
+    fetcher = StubFetcher([[item("Storm warning")], ConnectionError("down"), ConnectionError("down")])
+    fetcher.stale_grace_seconds = 60
+
+    async def scenario():
+        await fetcher.fetch()
+        expire(fetcher)
+        within = (await fetcher.refresh(), await fetcher.fetch())
+        expire(fetcher, seconds_ago=120)
+        return within, (await fetcher.refresh(), await fetcher.fetch())
+
+    (ok, served), (ok_after, served_after) = asyncio.run(scenario())
+    assert not ok and [i.title for i in served] == ["Storm warning"]
+    assert not ok_after and served_after == []
+
+
+def test_cold_failure_is_reported_so_it_is_retried():
+    fetcher = StubFetcher([ConnectionError("down")])
+    assert asyncio.run(fetcher.refresh()) is False
+    assert fetcher._cache.peek(fetcher._CACHE_KEY) is None
+
+
+def test_results_about_today_expire_at_midnight():
+    fetcher = StubFetcher([])
+    fetcher.cache_ttl_seconds = 7 * 86400
+    fetcher.expires_at_midnight = True
+    assert 0 < fetcher._result_ttl_seconds() <= 86400
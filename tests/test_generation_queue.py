@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from app.services.generation_queue import GenerationQueue, GenerationQueueFull, Priority
+
+
+async def hold(queue: GenerationQueue, priority: Priority, started: list, release: asyncio.Event, name: str):
+    async with queue.slot(priority):
+        started.append(name)
+        await release.wait()
+
+
+def test_waiters_are_served_by_priority_then_arrival():
+    async def scenario():
+        queue = GenerationQueue(concurrency=1, max_waiting=10)
+        release = asyncio.Event()
+        started = []
+
+        tasks = [asyncio.create_task(hold(queue, Priority.SCHEDULED, started, release, "first"))]
+        await asyncio.sleep(0)
+        for name, priority in [("pregen", Priority.PREGENERATE), ("daily", Priority.SCHEDULED),
+                               ("chat", Priority.INTERACTIVE)]:
+            tasks.append(asyncio.create_task(hold(queue, priority, started, release, name)))
+        await asyncio.sleep(0)
+        assert queue.depth == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+        return started, queue
+
+    started, queue = asyncio.run(scenario())
+    assert started == ["first", "chat", "daily", "pregen"]
+    assert queue.active == 0 and queue.is_idle
+
+
+def test_cancelled_waiter_hands_its_turn_to_the_next():
+    async def scenario():
+        queue = GenerationQueue(concurrency=1, max_waiting=10)
+        release = asyncio.Event()
+        started = []
+
+        holder = asyncio.create_task(hold(queue, Priority.SCHEDULED, started, release, "holder"))
+        await asyncio.sleep(0)
+        cancelled = asyncio.create_task(hold(queue, Priority.INTERACTIVE, started, release, "cancelled"))
+        waiting = asyncio.create_task(hold(queue, Priority.SCHEDULED, started, release, "waiting"))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        release.set()
+        await asyncio.gather(holder, waiting)
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        return started, queue
+
+    started, queue = asyncio.run(scenario())
+    assert started == ["holder", "waiting"]
+    assert queue.active == 0 and queue.depth == 0
+
+
+def test_slot_handed_over_while_cancelling_is_released():
+    async def scenario():
+        queue = GenerationQueue(concurrency=1, max_waiting=10)
+        release = asyncio.Event()
+        started = []
+
+        async with queue.slot(Priority.SCHEDULED):
+            waiter = asyncio.create_task(hold(queue, Priority.INTERACTIVE, started, release, "waiter"))
+            await asyncio.sleep(0)
+        # The slot was handed to the waiter on exit; cancel it before it gets to run
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return started, queue
+
+    started, queue = asyncio.run(scenario())
+    assert started == []
+    assert queue.active == 0 and queue.is_idle
+
+
+def test_rejects_once_max_waiting_is_reached():
+    async def scenario():
+        queue = GenerationQueue(concurrency=1, max_waiting=1)
+        release = asyncio.Event()
+        started = []
+
+        tasks = [asyncio.create_task(hold(queue, Priority.SCHEDULED, started, release, str(i))) for i in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(GenerationQueueFull):
+            async with queue.slot(Priority.INTERACTIVE):
+                pass
+
+        release.set()
+        await asyncio.gather(*tasks)
+        return queue
+
+    queue = asyncio.run(scenario())
+    assert queue.rejected[Priority.INTERACTIVE] == 1
+    assert queue.served[Priority.SCHEDULED] == 2
@@ -0,0 +1,60 @@
+from app.fetchers.base import ContentCategory
+from app.fetchers.ranking import score, select_top_k
+
+NOW = 1_700_000_000.0
+
+
+def titles(items):
+    return [item.title for item in items]
+
+
+def test_returns_best_k_in_fetch_order(item):
+    items = [item("low", relevance_score=0.2), item("high", relevance_score=0.9), item("mid", relevance_score=0.5)]
+    assert titles(select_top_k(items, 2, quotas={}, now=NOW)) == ["high", "mid"]
+
+
+def test_quotas_cap_each_category(item):
+    items = [item(f"local {i}", relevance_score=0.9) for i in range(4)]
+    items.append(item("tech", category=ContentCategory.TECH, relevance_score=0.1))
+    chosen = select_top_k(items, 4, quotas={"local_news": 2}, now=NOW)
+    assert titles(chosen) == ["local 0", "local 1", "tech"]
+
+
+def test_weather_is_always_included(item):
+    items = [item(f"local {i}", relevance_score=0.9) for i in range(3)]
+    items.append(item("forecast", category=ContentCategory.WEATHER, relevance_score=0.1))
+    assert "forecast" in titles(select_top_k(items, 2, quotas={}, now=NOW))
+
+
+def test_zero_weight_excludes_a_category(item):
+    items = [
+        item("local", relevance_score=0.9),
+        item("tech", category=ContentCategory.TECH, relevance_score=0.5),
+        item("forecast", category=ContentCategory.WEATHER),
+    ]
+    chosen = select_top_k(items, 5, quotas={}, weights={"tech": 0, "weather": 0}, now=NOW)
+    assert titles(chosen) == ["local"]
+
+
+def test_weights_reorder_categories(item):
+    items = [item("local", relevance_score=0.9), item("tech", category=ContentCategory.TECH, relevance_score=0.5)]
+    assert titles(select_top_k(items, 1, quotas={}, weights={"tech": 2.0}, now=NOW)) == ["tech"]
+
+
+def test_ties_keep_fetch_order(item):
+    items = [item(f"story {i}", relevance_score=0.5) for i in range(6)]
+    first = select_top_k(items, 3, quotas={}, now=NOW)
+    assert titles(first) == ["story 0", "story 1", "story 2"]
+    assert select_top_k(items, 3, quotas={}, now=NOW) == first
+
+
+def test_older_stories_score_lower(item):
+    fresh = item("fresh", published_at=NOW)
+    day_old = item("day old", published_at=NOW - 86400)
+    undated = item("undated")
+    assert score(fresh, now=NOW) == score(undated, now=NOW) == 1.0
+    assert score(day_old, half_life_hours=24, now=NOW) == 0.75
+
+
+def test_time_sensitive_items_get_a_bonus(item):
+    assert score(item("storm", is_time_sensitive=True), now=NOW) > score(item("storm"), now=NOW)
@@ -0,0 +1,75 @@
+from app.services.agents.reasoning import ReasoningFilter
+
+
+def feed_all(chunks, reasoning_filter=None):
+    reasoning_filter = reasoning_filter or ReasoningFilter()
+    return "".join(reasoning_filter.feed(chunk) for chunk in chunks) + reasoning_filter.flush()
+
+
+def test_passes_text_without_reasoning():
+    assert feed_all(["Hello ", "there"]) == "Hello there"
+
+
+def test_strips_a_leading_block():
+    assert feed_all(["<think>plan the reply</think>", "Morning!"]) == "Morning!"
+
+
+def test_strips_tags_split_across_chunks():
+    chunks = ["Hi <th", "ink>secret", " thoughts</th", "ink> there", " <", "3"]
+    assert feed_all(chunks) == "Hi  there <3"
+
+
+def test_strips_tags_split_one_character_at_a_time():
+    text = "A<think>x</think>B<think>y</think>C"
+    assert feed_all(list(text)) == "ABC"
+
+
+def test_strips_multiple_blocks():
+    assert feed_all(["one <think>a</think>two <think>b</think>three"]) == "one two three"
+
+
+def test_drops_reasoning_before_a_leading_closing_tag():
+    assert feed_all(["leaked</think>Answer"]) == "Answer"
+
+
+def test_holding_drops_leading_reasoning_split_across_chunks():
+    chunks = ["I should ", "greet them", "</th", "ink>", "Answer"]
+    assert feed_all(chunks, ReasoningFilter(hold_leading_text=True)) == "Answer"
+
+
+def test_holding_returns_untagged_replies_on_flush():
+    reasoning_filter = ReasoningFilter(hold_leading_text=True)
+    assert reasoning_filter.feed("Just an ") == ""
+    assert reasoning_filter.feed("answer") == ""
+    assert reasoning_filter.flush() == "Just an answer"
+
+
+def test_holding_releases_text_once_a_block_opens():
+    reasoning_filter = ReasoningFilter(hold_leading_text=True)
+    assert reasoning_filter.feed("Hi ") == ""
+    assert reasoning_filter.feed("<think>x</think>there") == "Hi there"
+
+
+def test_stray_closing_tag_after_visible_text_is_removed():
+    assert feed_all(["Answer", " here</think> too"]) == "Answer here too"
+
+
+def test_unclosed_block_is_dropped_on_flush():
+    assert feed_all(["Answer<think>still thinking"]) == "Answer"
+
+
+def test_only_partial_tag_is_held_back():
+    reasoning_filter = ReasoningFilter()
+    assert reasoning_filter.feed("Hello <thi") == "Hello "
+    assert reasoning_filter.feed("s is fine") == "<this is fine"
+
+
+def test_budget_counts_reasoning_chunks():
+    reasoning_filter = ReasoningFilter(max_reasoning_tokens=2)
+    for chunk in ["<think>", "a"]:
+        reasoning_filter.feed(chunk)
+    assert not reasoning_filter.budget_exceeded
+    reasoning_filter.feed("b")
+    assert reasoning_filter.budget_exceeded
+    reasoning_filter.feed("</think>done")
+    assert not reasoning_filter.budget_exceeded
@@ -0,0 +1,22 @@
+from app.services.seen import SeenItems, covered_items
+
+MESSAGE = (
+    "Morning Sam! Heads up: Metro fares are going up in April. "
+    "Also, big news for the Freeman - the hospital just picked up an award!"
+)
+
+
+def test_covered_items_matches_rewritten_stories(item):
+    fares = item("Metro fares to rise by 5% from April - BBC News", publisher_in_title=True)
+    award = item("Freeman Hospital wins national award")
+    bridge = item("New bridge opens over the Tyne")
+    assert covered_items(MESSAGE, [fares, bridge, award]) == [fares, award]
+
+
+def test_only_covered_items_are_kept_out_of_the_next_digest(item):
+    seen = SeenItems(path=None)
+    fares = item("Metro fares to rise by 5% from April")
+    bridge = item("New bridge opens over the Tyne")
+    seen.mark(1, covered_items(MESSAGE, [fares, bridge]))
+    assert seen.filter(1, [fares, bridge]) == [bridge]
+    assert seen.filter(2, [fares, bridge]) == [fares, bridge]